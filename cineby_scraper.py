@@ -11,16 +11,42 @@
        set environment variables:  TMDB_API_KEY  /  TMDB_READ_TOKEN
     2. Run: python cineby_scraper.py
     3. Output: cineby_content.xlsx  (in the same directory)
+       Add --fast to stream the workbook through XlsxWriter instead
+       (done automatically once a sheet reaches FAST_WRITER_ROWS rows)
 ==========================================================================
 """
 
 import os
+import re
 import sys
 import time
 import json
-import requests
+import threading
+from copy import copy
+from itertools import count
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# orjson parses the number-heavy TMDB payloads several times faster than the
+# stdlib; fall back to json (which also accepts bytes) if it isn't installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional on-disk cache for idempotent TMDB GETs across runs
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional streaming XLSX writer used by --fast
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CONFIG — paste your credentials here, OR let the script ask you at runtime
 # ─────────────────────────────────────────────────────────────────────────────
@@ -28,15 +54,21 @@ TMDB_API_KEY    = os.getenv("TMDB_API_KEY", "")
 TMDB_READ_TOKEN = os.getenv("TMDB_READ_TOKEN", "")
 
 # ── Auto-load from .env file if present ───────────────────────────────────────
+# KEY=value per line; optional "export " prefix and "..." / '...' quoting.
+# Comments and blank lines never match.
+_ENV_RE = re.compile(
+    r"""^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))\s*$""",
+    re.M,
+)
+
 def _load_env():
     env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
     if os.path.exists(env_path):
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    k, _, v = line.partition("=")
-                    os.environ.setdefault(k.strip(), v.strip())
+        with open(env_path, encoding="utf-8") as f:
+            text = f.read()
+        for k, dq, sq, bare in _ENV_RE.findall(text):
+            os.environ.setdefault(k, dq or sq or bare)
 
 _load_env()
 # Already set above via os.getenv, but keeping the fallback logic safe
@@ -51,7 +83,15 @@ MAX_PAGES_ANIME     = 2500
 MAX_PAGES_CHANNELS  = 10
 
 OUTPUT_FILE         = "cineby_content.xlsx"
-REQUEST_DELAY       = 0.25   # seconds between API calls (respect rate limits)
+FAST_WRITER_ROWS    = 5000   # sheets this large switch the export to --fast; None = never
+DB_FILE             = "content.db"   # SQLite store of every scraped row (see store.py)
+RATE_LIMIT_CALLS    = 40     # at most 40 requests…
+RATE_LIMIT_PERIOD   = 10.0   # …per 10 seconds (shared by all worker threads)
+MAX_WORKERS         = 20     # concurrent in-flight page requests per endpoint
+ENDPOINT_WORKERS    = 8      # endpoints (list / slice / year queries) fetched in parallel
+MAX_IN_FLIGHT       = 20     # cap on simultaneous TMDB requests across all workers
+HTTP_CACHE_FILE     = "tmdb_cache"  # requests-cache SQLite file (.sqlite appended)
+HTTP_CACHE_EXPIRE   = 3600   # seconds a cached TMDB response stays fresh; 0 disables
 
 # ── Incremental / Resume Mode ─────────────────────────────────────────────────
 # If True  → on re-run, load existing Excel data and only add NEW items.
@@ -64,6 +104,13 @@ BASE_URL = "https://api.themoviedb.org/3"
 IMAGE_BASE = "https://image.tmdb.org/t/p/w185"
 CINEBY_BASE = "https://www.cineby.gd"
 VIDKING_BASE = "https://www.vidking.net"
+BACKDROP_BASE = "https://image.tmdb.org/t/p/original"
+
+# Per-record URL prefixes, built once instead of per normalised row
+CINEBY_MOVIE  = CINEBY_BASE + "/movie/"
+CINEBY_TV     = CINEBY_BASE + "/tv/"
+VIDKING_MOVIE = VIDKING_BASE + "/embed/movie/"
+VIDKING_TV    = VIDKING_BASE + "/embed/tv/"
 
 # TMDB Genre ID → Name mapping
 GENRE_MAP = {
@@ -77,35 +124,80 @@ GENRE_MAP = {
     10764: "Reality", 10765: "Sci-Fi & Fantasy", 10766: "Soap",
     10767: "Talk", 10768: "War & Politics",
 }
+# Bound once — get_genre_names runs for every normalised row
+_GENRE_GET = GENRE_MAP.get
+_STR       = str
+_EMPTY     = ()
 
 # ─────────────────────────────────────────────────────────────────────────────
 
-def check_dependencies():
-    missing = []
-    for pkg in ["requests", "openpyxl", "tqdm"]:
-        try:
-            __import__(pkg)
-        except ImportError:
-            missing.append(pkg)
-    if missing:
-        print(f"[!] Missing packages: {', '.join(missing)}")
-        print(f"    Install with: pip install {' '.join(missing)}")
-        sys.exit(1)
-
-check_dependencies()
-
-from openpyxl import Workbook
-from openpyxl.styles import (Font, PatternFill, Alignment, Border, Side,
-                              GradientFill)
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.hyperlink import Hyperlink
-from tqdm import tqdm
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from openpyxl import Workbook
+    from openpyxl.styles import (Font, PatternFill, Alignment, Border, Side,
+                                  GradientFill)
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.hyperlink import Hyperlink
+    from tqdm import tqdm
+except ImportError as e:
+    print(f"[!] Missing package: {e.name}")
+    print("    Install with: pip install -r requirements.txt")
+    sys.exit(1)
+
+import store
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  API CLIENT
 # ─────────────────────────────────────────────────────────────────────────────
 
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `calls` requests per `period` seconds.
+    Bursts up to `calls` go through immediately; callers only block once the
+    budget is spent, and then only until the next token refills.
+    """
+    def __init__(self, calls, period):
+        self.capacity  = float(calls)
+        self.tokens    = float(calls)
+        self.fill_rate = calls / period
+        self.updated   = time.perf_counter()
+        self.lock      = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.perf_counter()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that takes a token from `limiter` and a slot in `in_flight`
+    for every request it sends. Mounted under the session, so responses
+    served by requests-cache — which never reach send() — cost neither.
+    """
+    def __init__(self, limiter, in_flight, **kwargs):
+        self.limiter   = limiter
+        self.in_flight = in_flight
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        with self.in_flight:
+            return super().send(request, **kwargs)
+
+
 class TMDBClient:
     def __init__(self):
         token = TMDB_READ_TOKEN
@@ -143,12 +235,46 @@ class TMDBClient:
                 self.params = {}
             print("[✓] Credentials accepted")
 
-        self.session = requests.Session()
+        # Pooled keep-alive session: warmed TLS sockets are reused across the
+        # concurrent page fetches, and urllib3 handles 429/5xx retries
+        # (honouring Retry-After) so get() doesn't have to. Those re-sends
+        # happen inside urllib3, below the rate limiter, so they are not
+        # counted against RATE_LIMIT_CALLS and can briefly exceed it.
+        self.limiter = TokenBucket(RATE_LIMIT_CALLS, RATE_LIMIT_PERIOD)
+        # Up to ENDPOINT_WORKERS × MAX_WORKERS threads may call get() at once;
+        # only MAX_IN_FLIGHT of them hold a connection at any moment.
+        self.in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+        adapter = ThrottledAdapter(self.limiter, self.in_flight,
+                                   pool_connections=32,
+                                   pool_maxsize=MAX_IN_FLIGHT,
+                                   max_retries=retry)
+        if requests_cache is not None and HTTP_CACHE_EXPIRE:
+            # Pages fetched within the last HTTP_CACHE_EXPIRE seconds are
+            # served from local SQLite instead of the network.
+            cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), HTTP_CACHE_FILE)
+            self.session = requests_cache.CachedSession(
+                cache_path, backend="sqlite",
+                expire_after=HTTP_CACHE_EXPIRE,
+                allowable_codes=(200,),
+                cache_control=True,
+            )
+            self.session.cache.delete(expired=True)
+            print(f"[✓] HTTP cache enabled ({HTTP_CACHE_EXPIRE}s) → {cache_path}.sqlite")
+        else:
+            self.session = requests.Session()
+        self.session.mount("https://", adapter)
         self.session.headers.update(self.headers)
+        self.session.headers["Connection"] = "keep-alive"
         
-        # Connection Test
+        # Connection Test (always against the live API, never the cache)
         try:
-            test_resp = self.session.get(f"{BASE_URL}/movie/popular", params={**self.params, "page": 1}, timeout=10)
+            test_resp = self._get_uncached(f"{BASE_URL}/movie/popular", params={**self.params, "page": 1}, timeout=10)
             if test_resp.status_code == 200:
                 print(f"[✓] Connection Verified: TMDB API is active and credentials are valid.")
             else:
@@ -158,70 +284,91 @@ class TMDBClient:
         except Exception as e:
             print(f"[!] Warning: Could not verify connection: {e}")
 
+    def _get_uncached(self, url, **kwargs):
+        if requests_cache is not None and isinstance(self.session, requests_cache.CachedSession):
+            with self.session.cache_disabled():
+                return self.session.get(url, **kwargs)
+        return self.session.get(url, **kwargs)
+
     def get(self, endpoint, extra_params=None):
         params = {**self.params}
         if extra_params:
             params.update(extra_params)
+        return self.get_prepared(endpoint, params)
+
+    def with_auth(self, params=None):
+        """Auth params merged with `params` — build once per endpoint, then add "page"."""
+        return {**self.params, **(params or {})}
+
+    def get_prepared(self, endpoint, params):
+        """get() for a params dict that already carries auth (see with_auth)."""
         url = f"{BASE_URL}{endpoint}"
-        for attempt in range(3):
-            try:
-                resp = self.session.get(url, params=params, timeout=15)
-                if resp.status_code == 429:  # rate limited
-                    wait = int(resp.headers.get("Retry-After", 5))
-                    print(f"\n[!] Rate limited — waiting {wait}s...")
-                    time.sleep(wait)
-                    continue
-                resp.raise_for_status()
-                return resp.json()
-            except requests.RequestException as e:
-                # Check for 401 Unauthorized via the exception's response object
-                if e.response is not None and e.response.status_code == 401:
-                    print(f"\n[!] 401 Unauthorized Error — Your TMDB credentials are invalid.")
-                    print("    Please check your .env file or run with fresh credentials.")
-                    sys.exit(1)
-                
-                if attempt == 2:
-                    print(f"\n[!] Request failed after 3 attempts: {e}")
-                    return None
-                time.sleep(2 ** attempt)
-        return None
+        try:
+            # Throttled in ThrottledAdapter.send(), so cache hits skip it
+            resp = self.session.get(url, params=params, timeout=15)
+            resp.raise_for_status()
+            return _json_loads(resp.content)
+        except requests.RequestException as e:
+            # Check for 401 Unauthorized via the exception's response object
+            if e.response is not None and e.response.status_code == 401:
+                print(f"\n[!] 401 Unauthorized Error — Your TMDB credentials are invalid.")
+                print("    Please check your .env file or run with fresh credentials.")
+                sys.exit(1)
+
+            print(f"\n[!] Request failed after retries: {e}")
+            return None
+        except ValueError as e:
+            # 200 with a non-JSON body (e.g. an HTML error page); orjson's
+            # decode error is not a RequestException like resp.json()'s was
+            print(f"\n[!] Invalid JSON from {endpoint}: {e}")
+            return None
 
     def fetch_all_pages(self, endpoint, params=None, max_pages=None, desc="Fetching"):
-        """Fetch all pages from a paginated TMDB endpoint."""
-        results = []
-        page = 1
-        total_pages = 1
-
-        if max_pages and max_pages > 500:
-            # We don't warning here because we handle it via loops,
-            # but per TMDB docs, any page > 500 returns 0 results.
-            pass
-
-        with tqdm(desc=desc, unit=" pages", dynamic_ncols=True) as pbar:
-            while page <= total_pages:
-                if max_pages and page > max_pages:
-                    break
-                if page > 500: # TMDB API HARD LIMIT
-                    break
-                data = self.get(endpoint, {**(params or {}), "page": page})
-                if not data:
-                    break
-
-                page_results = data.get("results", [])
-                results.extend(page_results)
-
-                total_pages = min(
-                    data.get("total_pages", 1),
-                    500  # TMDB hard cap per query. 
-                         # We bypass this by 'slicing' (yearly/regional queries).
-                )
-                pbar.total = min(total_pages, max_pages or total_pages)
-                pbar.set_postfix({"items": len(results), "total_pages": total_pages})
-                pbar.update(1)
-
-                page += 1
-                time.sleep(REQUEST_DELAY)
+        """
+        Fetch all pages from a paginated TMDB endpoint.
+
+        Page 1 is fetched first to discover total_pages; the remaining pages
+        are then requested concurrently (MAX_WORKERS in flight) and stitched
+        back together in page order.
+        """
+        base_params = self.with_auth(params)
+
+        with tqdm(desc=desc, unit=" pages", dynamic_ncols=True, **_bar_slot()) as pbar:
+            first = self.get_prepared(endpoint, {**base_params, "page": 1})
+            if not first:
+                return []
+
+            total_pages = min(
+                first.get("total_pages", 1),
+                500  # TMDB hard cap per query.
+                     # We bypass this by 'slicing' (yearly/regional queries).
+            )
+            if max_pages:
+                total_pages = min(total_pages, max_pages)
+            pbar.total = total_pages
 
+            pages = {1: first.get("results", [])}
+            n_items = len(pages[1])
+            pbar.set_postfix({"items": n_items, "total_pages": total_pages})
+            pbar.update(1)
+
+            if total_pages > 1:
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                    futures = {
+                        pool.submit(self.get_prepared, endpoint, {**base_params, "page": page}): page
+                        for page in range(2, total_pages + 1)
+                    }
+                    for fut in as_completed(futures):
+                        data = fut.result() or {}
+                        page_results = data.get("results", [])
+                        pages[futures[fut]] = page_results
+                        n_items += len(page_results)
+                        pbar.set_postfix({"items": n_items, "total_pages": total_pages})
+                        pbar.update(1)
+
+        results = []
+        for page in sorted(pages):
+            results.extend(pages[page])
         return results
 
 
@@ -229,10 +376,12 @@ class TMDBClient:
 #  INCREMENTAL HELPERS — load what's already saved in the Excel file
 # ─────────────────────────────────────────────────────────────────────────────
 
-def load_existing_rows(output_path, sheet_name, id_col="TMDB ID"):
+def load_existing_rows(output_path, sheet_name, headers, id_col="TMDB ID"):
     """
-    Read all rows from a sheet in an existing Excel file.
-    Returns (list_of_dicts, set_of_ids).
+    Read all rows from a sheet in an existing Excel file as raw value tuples
+    ordered like `headers` (columns missing from the file read as None),
+    ready to be handed straight back to write_sheet.
+    Returns (list_of_tuples, set_of_ids).
     Returns ([], set()) if the file or sheet doesn't exist.
     """
     if not os.path.exists(output_path):
@@ -245,17 +394,24 @@ def load_existing_rows(output_path, sheet_name, id_col="TMDB ID"):
             return [], set()
         ws = wb[sheet_name]
         rows_iter = ws.iter_rows(values_only=True)
-        headers = [str(h) if h is not None else "" for h in next(rows_iter)]
+        file_headers = [str(h) if h is not None else "" for h in next(rows_iter)]
+        id_idx = file_headers.index(id_col) if id_col in file_headers else None
+
+        # Same layout as we write → keep the tuples as-is; otherwise remap once
+        positions = None
+        if file_headers[:len(headers)] != list(headers):
+            positions = [file_headers.index(h) if h in file_headers else None
+                         for h in headers]
+
         data = []
         ids  = set()
-        id_idx = headers.index(id_col) if id_col in headers else None
+        append, ids_add = data.append, ids.add
         for row in rows_iter:
-            row_dict = dict(zip(headers, row))
-            # Restore None → "" for cleanliness
-            row_dict = {k: (v if v is not None else "") for k, v in row_dict.items()}
-            data.append(row_dict)
             if id_idx is not None and row[id_idx] is not None:
-                ids.add(row[id_idx])
+                ids_add(row[id_idx])
+            if positions is not None:
+                row = tuple(row[i] if i is not None else None for i in positions)
+            append(row)
         wb.close()
         return data, ids
     except Exception as e:
@@ -268,15 +424,18 @@ def fetch_incremental(client, endpoint, params, existing_ids, max_pages, desc, s
     Like fetch_all_pages but stops early if stop_early=True and a full page 
     of results contains only IDs that already exist in existing_ids.
     """
+    existing_ids = frozenset(existing_ids)
+    contains = existing_ids.__contains__
+    base_params = client.with_auth(params)
     results = []
     page = 1
     total_pages = 1
 
-    with tqdm(desc=desc, unit=" pages", dynamic_ncols=True) as pbar:
+    with tqdm(desc=desc, unit=" pages", dynamic_ncols=True, **_bar_slot()) as pbar:
         while page <= total_pages:
             if max_pages and page > max_pages:
                 break
-            data = client.get(endpoint, {**(params or {}), "page": page})
+            data = client.get_prepared(endpoint, {**base_params, "page": page})
             if not data:
                 break
 
@@ -284,7 +443,7 @@ def fetch_incremental(client, endpoint, params, existing_ids, max_pages, desc, s
             total_pages = min(data.get("total_pages", 1), 500)
             pbar.total = min(total_pages, max_pages or total_pages)
 
-            new_on_page = [r for r in page_results if r.get("id") not in existing_ids]
+            new_on_page = [r for r in page_results if not contains(r["id"])]
             results.extend(new_on_page)
 
             pbar.set_postfix({
@@ -296,76 +455,127 @@ def fetch_incremental(client, endpoint, params, existing_ids, max_pages, desc, s
 
             # If the entire page had no new items → TMDB is sorted by
             # popularity/date so older items follow — safe to stop here.
-            if stop_early and len(new_on_page) == 0 and page > 1:
+            if stop_early and not new_on_page and page > 1:
                 pbar.set_postfix({"status": "up-to-date ✓", "new": len(results)})
                 break
 
             page += 1
-            time.sleep(REQUEST_DELAY)
 
     return results
 
 
+# Terminal row of the current fetch_endpoints worker's progress bar
+_bar_row = threading.local()
+
+
+def _bar_slot():
+    """
+    tqdm options for a per-endpoint progress bar. Inside fetch_endpoints each
+    worker thread draws on its own fixed row and clears it when done, so
+    concurrent bars don't overwrite each other; elsewhere tqdm's defaults.
+    """
+    position = getattr(_bar_row, "position", None)
+    if position is None:
+        return {}
+    return {"position": position, "leave": False}
+
+
+def fetch_endpoints(fetch_fn, client, jobs):
+    """
+    Run fetch_fn for every (endpoint, params, existing_ids, max_pages, desc,
+    stop_early) job on a thread pool — the endpoints are independent, so
+    their network waits overlap. Returns one result list per job, in job
+    order, so de-duplication downstream sees the same order as a serial run.
+    """
+    rows = count()
+
+    def claim_row():
+        _bar_row.position = next(rows)
+
+    with ThreadPoolExecutor(max_workers=ENDPOINT_WORKERS, initializer=claim_row) as pool:
+        futures = [
+            pool.submit(fetch_fn, client, ep, params, ex_ids, max_pages, desc,
+                        stop_early=stop_early)
+            for ep, params, ex_ids, max_pages, desc, stop_early in jobs
+        ]
+        return [fut.result() for fut in futures]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  DATA FETCHERS
 # ─────────────────────────────────────────────────────────────────────────────
 
-def dedupe(items, key="id"):
+def normalize_new(items, normalize, existing_ids=frozenset()):
+    """
+    Normalise raw TMDB items in a single pass, skipping missing IDs, repeats
+    within `items` and IDs already in `existing_ids`. First-seen order is kept.
+    """
+    # existing_ids is only probed, never copied: the seen set grows with the
+    # new items alone, not with the whole store.
+    known = existing_ids.__contains__
     seen = set()
-    out = []
+    add = seen.add
+    rows = []
+    append = rows.append
     for item in items:
-        v = item.get(key)
-        if v and v not in seen:
-            seen.add(v)
-            out.append(item)
-    return out
+        item_id = item.get("id")
+        if item_id and item_id not in seen and not known(item_id):
+            add(item_id)
+            append(normalize(item))
+    return rows
 
 
 def get_genre_names(genre_ids):
-    return ", ".join(GENRE_MAP.get(gid, str(gid)) for gid in (genre_ids or []))
+    return ", ".join([_GENRE_GET(gid, _STR(gid)) for gid in (genre_ids or _EMPTY)])
 
 
 def normalize_movie(item):
-    tmdb_id = item.get("id", "")
+    tmdb_id  = item.get("id", "")
+    sid      = str(tmdb_id)
+    poster   = item.get("poster_path")
+    backdrop = item.get("backdrop_path")
     return {
         "TMDB ID":         tmdb_id,
-        "Title":           item.get("title", item.get("name", "")),
-        "Original Title":  item.get("original_title", item.get("original_name", "")),
+        "Title":           item["title"] if "title" in item else item.get("name", ""),
+        "Original Title":  item["original_title"] if "original_title" in item else item.get("original_name", ""),
         "Overview":        item.get("overview", ""),
         "Release Date":    item.get("release_date", ""),
         "Rating (TMDB)":   round(item.get("vote_average", 0), 1),
         "Vote Count":      item.get("vote_count", 0),
         "Popularity":      round(item.get("popularity", 0), 2),
         "Language":        item.get("original_language", ""),
-        "Genres":          get_genre_names(item.get("genre_ids", [])),
-        "Poster":          f"{IMAGE_BASE}{item.get('poster_path', '')}" if item.get("poster_path") else "",
-        "Backdrop":        f"https://image.tmdb.org/t/p/original{item.get('backdrop_path', '')}" if item.get("backdrop_path") else "",
-        "Cineby URL":      f"{CINEBY_BASE}/movie/{tmdb_id}",
-        "Vidking Embed":   f"{VIDKING_BASE}/embed/movie/{tmdb_id}",
+        "Genres":          get_genre_names(item.get("genre_ids")),
+        "Poster":          IMAGE_BASE + poster if poster else "",
+        "Backdrop":        BACKDROP_BASE + backdrop if backdrop else "",
+        "Cineby URL":      CINEBY_MOVIE + sid,
+        "Vidking Embed":   VIDKING_MOVIE + sid,
         "Adult":           item.get("adult", False),
     }
 
 
 def normalize_tv(item, is_anime=False):
-    tmdb_id = item.get("id", "")
+    tmdb_id  = item.get("id", "")
+    sid      = str(tmdb_id)
+    poster   = item.get("poster_path")
+    backdrop = item.get("backdrop_path")
     return {
         "TMDB ID":         tmdb_id,
-        "Title":           item.get("name", item.get("title", "")),
-        "Original Title":  item.get("original_name", item.get("original_title", "")),
+        "Title":           item["name"] if "name" in item else item.get("title", ""),
+        "Original Title":  item["original_name"] if "original_name" in item else item.get("original_title", ""),
         "Overview":        item.get("overview", ""),
         "First Air Date":  item.get("first_air_date", ""),
         "Rating (TMDB)":   round(item.get("vote_average", 0), 1),
         "Vote Count":      item.get("vote_count", 0),
         "Popularity":      round(item.get("popularity", 0), 2),
         "Language":        item.get("original_language", ""),
-        "Genres":          get_genre_names(item.get("genre_ids", [])),
+        "Genres":          get_genre_names(item.get("genre_ids")),
         "Origin Country":  ", ".join(item.get("origin_country", [])),
         "Is Anime":        "Yes" if is_anime else "No",
-        "Poster":          f"{IMAGE_BASE}{item.get('poster_path', '')}" if item.get("poster_path") else "",
-        "Backdrop":        f"https://image.tmdb.org/t/p/original{item.get('backdrop_path', '')}" if item.get("backdrop_path") else "",
-        "Cineby URL":      f"{CINEBY_BASE}/tv/{tmdb_id}",
-        "Cineby Ep1 URL":  f"{CINEBY_BASE}/tv/{tmdb_id}/1/1",
-        "Vidking Embed":   f"{VIDKING_BASE}/embed/tv/{tmdb_id}/1/1",
+        "Poster":          IMAGE_BASE + poster if poster else "",
+        "Backdrop":        BACKDROP_BASE + backdrop if backdrop else "",
+        "Cineby URL":      CINEBY_TV + sid,
+        "Cineby Ep1 URL":  CINEBY_TV + sid + "/1/1",
+        "Vidking Embed":   VIDKING_TV + sid + "/1/1",
     }
 
 
@@ -381,11 +591,12 @@ def normalize_channel(item):
     }
 
 
-def fetch_networks(client, max_pages=10):
+def fetch_networks(client, max_pages=10, existing_ids=frozenset()):
     """
     TMDB doesn't have a direct 'list all networks' endpoint.
     We discover them by querying popular TV shows and collecting
     unique networks. Also fetch the most popular TMDB networks directly.
+    Networks already in `existing_ids` are skipped before their detail lookup.
     """
     print("\n📡  Fetching TV Networks / Channels...")
     networks = {}
@@ -415,25 +626,20 @@ def fetch_networks(client, max_pages=10):
     ]
     network_ids.update(known_networks)
 
+    network_ids.discard(None)
+    # Stored channels are never updated (INSERT OR IGNORE), so their
+    # /network/{id} lookups would be thrown away
+    network_ids.difference_update(existing_ids)
     print(f"  → Fetching details for {len(network_ids)} unique networks...")
-    detailed = []
-    for nid in tqdm(network_ids, desc="  Network details", unit=" networks"):
-        if nid is None:
-            continue
-        data = client.get(f"/network/{nid}")
-        if data and data.get("id"):
-            detailed.append({
-                "Network ID":   data.get("id", ""),
-                "Name":         data.get("name", ""),
-                "Country":      data.get("origin_country", ""),
-                "Logo":         f"https://image.tmdb.org/t/p/w185{data.get('logo_path', '')}" if data.get("logo_path") else "",
-                "Headquarters": data.get("headquarters", ""),
-                "Homepage":     data.get("homepage", ""),
-                "TMDB Page":    f"https://www.themoviedb.org/network/{nid}",
-            })
-        time.sleep(REQUEST_DELAY)
 
-    return detailed
+    # One concurrent wave of /network/{id} lookups instead of a serial loop
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        details = list(tqdm(
+            pool.map(lambda nid: client.get(f"/network/{nid}"), network_ids),
+            total=len(network_ids), desc="  Network details", unit=" networks",
+        ))
+
+    return [normalize_channel(data) for data in details if data and data.get("id")]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -453,6 +659,23 @@ COLOR_TEXT_LIGHT  = "FFFFFF"
 COLOR_TEXT_DIM    = "AAAAAA"
 COLOR_LINK        = "0dcaf0"
 
+# Sheet layouts
+MOVIE_HEADERS = [
+    "TMDB ID", "Title", "Overview", "Release Date",
+    "Rating (TMDB)", "Vote Count", "Popularity", "Language",
+    "Genres", "Cineby URL", "Vidking Embed", "Poster", "Adult",
+]
+TV_HEADERS = [
+    "TMDB ID", "Title", "Overview", "First Air Date",
+    "Rating (TMDB)", "Vote Count", "Popularity", "Language",
+    "Genres", "Origin Country", "Cineby URL", "Cineby Ep1 URL",
+    "Vidking Embed", "Poster",
+]
+CHANNEL_HEADERS = [
+    "Network ID", "Name", "Country", "Headquarters",
+    "Homepage", "TMDB Page", "Logo",
+]
+
 
 def make_header_style(hex_color, bold=True):
     fill = PatternFill("solid", fgColor=hex_color)
@@ -467,59 +690,101 @@ def make_header_style(hex_color, bold=True):
 def apply_headers(ws, headers, color):
     fill, font, align, border = make_header_style(color)
     ws.row_dimensions[1].height = 32
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
+    Cell = WriteOnlyCell
+    row = []
+    for header in headers:
+        cell = Cell(ws, value=header)
         cell.fill = fill
         cell.font = font
         cell.alignment = align
         cell.border = border
+        row.append(cell)
+    ws.append(row)
 
 
-def style_data_row(ws, row_idx, num_cols, url_cols=None, url_col_indices=None):
-    fill_color = COLOR_ROW_ALT if row_idx % 2 == 0 else COLOR_ROW_MAIN
-    fill = PatternFill("solid", fgColor=fill_color)
-    for col_idx in range(1, num_cols + 1):
-        cell = ws.cell(row=row_idx, column=col_idx)
-        cell.fill = fill
-        is_url = url_col_indices and col_idx in url_col_indices
-        cell.font = Font(
-            color=COLOR_LINK if is_url else COLOR_TEXT_LIGHT,
-            size=10,
-            name="Segoe UI",
-            underline="single" if is_url else None,
-        )
-        cell.alignment = Alignment(
-            vertical="center",
-            wrap_text=(col_idx == 3),  # wrap Overview column
-        )
+def data_row_styles(ws, headers, url_col_indices=None):
+    """
+    Build the per-column style templates for data rows, as a pair
+    (even rows, odd rows) indexed by row_idx & 1.
+
+    Only 2 fills, 2 fonts and 2 alignments exist per sheet. Each distinct
+    combination is registered with the workbook once, on a template cell;
+    write_sheet then stamps that cell's style ids onto every data cell
+    instead of re-hashing Font/PatternFill/Alignment per cell.
+    """
+    fill_even  = PatternFill("solid", fgColor=COLOR_ROW_ALT)
+    fill_odd   = PatternFill("solid", fgColor=COLOR_ROW_MAIN)
+    font_txt   = Font(color=COLOR_TEXT_LIGHT, size=10, name="Segoe UI")
+    font_url   = Font(color=COLOR_LINK, size=10, name="Segoe UI", underline="single")
+    align_wrap   = Alignment(vertical="center", wrap_text=True)
+    align_nowrap = Alignment(vertical="center", wrap_text=False)
+    url_cols     = url_col_indices or ()
+
+    templates = {}
+
+    def template(fill, is_url, wrap):
+        key = (fill is fill_odd, is_url, wrap)
+        if key not in templates:
+            cell = WriteOnlyCell(ws)
+            cell.fill = fill
+            cell.font = font_url if is_url else font_txt
+            cell.alignment = align_wrap if wrap else align_nowrap
+            templates[key] = cell._style
+        return templates[key]
+
+    row_styles = []
+    for fill in (fill_even, fill_odd):
+        styles = []
+        for col_idx, header in enumerate(headers, 1):
+            is_url = col_idx in url_cols
+            styles.append((template(fill, is_url, header == "Overview"), is_url))
+        row_styles.append(styles)
+    return tuple(row_styles)
+
+
+DEFAULT_COL_WIDTHS = {
+    "TMDB ID": 10, "Network ID": 10, "Title": 35, "Original Title": 30,
+    "Overview": 55, "Description": 55, "Release Date": 14,
+    "First Air Date": 14, "Rating (TMDB)": 14, "Vote Count": 12,
+    "Popularity": 12, "Language": 10, "Genres": 30, "Origin Country": 16,
+    "Is Anime": 10, "Adult": 8, "Poster": 16, "Backdrop": 16,
+    "Cineby URL": 40, "Cineby Ep1 URL": 42, "Vidking Embed": 42,
+    "Name": 35, "Country": 10, "Logo": 16,
+    "Headquarters": 25, "Homepage": 35, "TMDB Page": 40,
+}
 
 
 def set_col_widths(ws, headers, widths=None):
-    default_widths = {
-        "TMDB ID": 10, "Network ID": 10, "Title": 35, "Original Title": 30,
-        "Overview": 55, "Description": 55, "Release Date": 14,
-        "First Air Date": 14, "Rating (TMDB)": 14, "Vote Count": 12,
-        "Popularity": 12, "Language": 10, "Genres": 30, "Origin Country": 16,
-        "Is Anime": 10, "Adult": 8, "Poster": 16, "Backdrop": 16,
-        "Cineby URL": 40, "Cineby Ep1 URL": 42, "Vidking Embed": 42,
-        "Name": 35, "Country": 10, "Logo": 16,
-        "Headquarters": 25, "Homepage": 35, "TMDB Page": 40,
-    }
+    default_get = DEFAULT_COL_WIDTHS.get
+    custom_get  = (widths or {}).get
+    col_dims    = ws.column_dimensions
+    col_letter  = get_column_letter
     for col_idx, header in enumerate(headers, 1):
-        width = (widths or {}).get(header, default_widths.get(header, 18))
-        ws.column_dimensions[get_column_letter(col_idx)].width = width
+        col_dims[col_letter(col_idx)].width = custom_get(header, default_get(header, 18))
+
+
+def rows_to_values(data_rows, headers):
+    """Lazily order row dicts by `headers`, in the shape write_sheet takes."""
+    header_tuple = tuple(headers)
+    return ([r.get(h, "") for h in header_tuple] for r in data_rows)
 
 
 def write_sheet(wb, sheet_name, tab_color, header_color, data_rows, headers,
                 url_headers=None):
+    """
+    Stream one data sheet into a write-only workbook. `data_rows` are value
+    sequences ordered like `headers` (see rows_to_values / load_existing_rows).
+    Write-only sheets are flushed row by row, so every sheet-level setting
+    (tab colour, panes, widths) has to be in place before the first append.
+    """
     ws = wb.create_sheet(title=sheet_name)
     ws.sheet_properties.tabColor = tab_color
     ws.freeze_panes = "A2"
 
     # Dark background for entire sheet (cosmetic — fill blank area)
     ws.sheet_view.showGridLines = False
-    apply_headers(ws, headers, header_color)
     set_col_widths(ws, headers)
+    apply_headers(ws, headers, header_color)
 
     url_col_indices = set()
     if url_headers:
@@ -527,28 +792,29 @@ def write_sheet(wb, sheet_name, tab_color, header_color, data_rows, headers,
             if h in url_headers:
                 url_col_indices.add(i)
 
-    for row_idx, row_data in enumerate(data_rows, 2):
-        ws.row_dimensions[row_idx].height = 22
-        for col_idx, header in enumerate(headers, 1):
-            val = row_data.get(header, "")
-            cell = ws.cell(row=row_idx, column=col_idx, value=val)
-            is_url = col_idx in url_col_indices
-            fill_color = COLOR_ROW_ALT if row_idx % 2 == 0 else COLOR_ROW_MAIN
-            cell.fill = PatternFill("solid", fgColor=fill_color)
-            cell.font = Font(
-                color=COLOR_LINK if is_url else COLOR_TEXT_LIGHT,
-                size=10, name="Segoe UI",
-                underline="single" if is_url else None,
-            )
-            cell.alignment = Alignment(
-                vertical="center",
-                wrap_text=(header == "Overview"),
-            )
+    row_styles = data_row_styles(ws, headers, url_col_indices)
+
+    # Bind everything the per-cell loop touches to locals once per sheet.
+    Cell     = WriteOnlyCell
+    _copy    = copy
+    row_dims = ws.row_dimensions
+    append   = ws.append
+
+    row_idx = 1
+    for row_idx, values in enumerate(data_rows, 2):
+        row_dims[row_idx].height = 22
+        cells = []
+        add = cells.append
+        for val, (style, is_url) in zip(values, row_styles[row_idx & 1]):
+            cell = Cell(ws, value=val)
+            cell._style = _copy(style)
             if is_url and val:
                 cell.hyperlink = val
+            add(cell)
+        append(cells)
 
     # Auto-filter
-    ws.auto_filter.ref = ws.dimensions
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{row_idx}"
     return ws
 
 
@@ -558,23 +824,26 @@ def write_summary_sheet(wb, stats):
     ws.sheet_view.showGridLines = False
     ws.column_dimensions["A"].width = 35
     ws.column_dimensions["B"].width = 20
+    dark_fill = PatternFill("solid", fgColor=COLOR_DARK_BG)
 
     # Title
-    ws.merge_cells("A1:B1")
-    title_cell = ws["A1"]
-    title_cell.value = "🎬 Cineby.gd Content Database"
+    ws.merged_cells.add("A1:B1")
+    title_cell = WriteOnlyCell(ws, value="🎬 Cineby.gd Content Database")
     title_cell.font = Font(bold=True, size=18, color=COLOR_TEXT_LIGHT, name="Segoe UI")
-    title_cell.fill = PatternFill("solid", fgColor=COLOR_DARK_BG)
+    title_cell.fill = dark_fill
     title_cell.alignment = Alignment(horizontal="center", vertical="center")
     ws.row_dimensions[1].height = 45
+    ws.append([title_cell])
 
-    ws.merge_cells("A2:B2")
-    sub_cell = ws["A2"]
-    sub_cell.value = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  |  Source: TMDB API + cineby.gd"
+    ws.merged_cells.add("A2:B2")
+    sub_cell = WriteOnlyCell(
+        ws, value=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  |  Source: TMDB API + cineby.gd")
     sub_cell.font = Font(size=10, color=COLOR_TEXT_DIM, name="Segoe UI", italic=True)
-    sub_cell.fill = PatternFill("solid", fgColor=COLOR_DARK_BG)
+    sub_cell.fill = dark_fill
     sub_cell.alignment = Alignment(horizontal="center", vertical="center")
     ws.row_dimensions[2].height = 22
+    ws.append([sub_cell])
+    ws.append([])  # spacer row
 
     rows = [
         ("Category",        "Total Items",   COLOR_HEADER_SUM),
@@ -596,9 +865,9 @@ def write_summary_sheet(wb, stats):
 
     for r_idx, (label, value, force_color) in enumerate(rows, 4):
         ws.row_dimensions[r_idx].height = 26
-        
-        lc = ws.cell(row=r_idx, column=1, value=label)
-        vc = ws.cell(row=r_idx, column=2, value=value)
+
+        lc = WriteOnlyCell(ws, value=label)
+        vc = WriteOnlyCell(ws, value=value)
 
         bg = force_color or COLOR_ROW_ALT if r_idx % 2 == 0 else COLOR_ROW_MAIN
         accent = label_colors.get(label)
@@ -611,24 +880,150 @@ def write_summary_sheet(wb, stats):
                 color=COLOR_TEXT_LIGHT,
                 name="Segoe UI",
             )
-            cell.alignment = Alignment(horizontal="left" if cell == lc else "right",
+            cell.alignment = Alignment(horizontal="left" if cell is lc else "right",
                                        vertical="center")
+        ws.append([lc, vc])
 
-    # Add a note
+    # Add a note (two blank rows below the table)
+    ws.append([])
+    ws.append([])
     note_row = len(rows) + 6
-    ws.merge_cells(f"A{note_row}:B{note_row}")
-    note = ws.cell(row=note_row, column=1,
-                   value="💡 Cineby uses TMDB IDs. Embed via Vidking: https://www.vidking.net/embed/movie/{tmdbId}")
+    ws.merged_cells.add(f"A{note_row}:B{note_row}")
+    note = WriteOnlyCell(ws, value="💡 Cineby uses TMDB IDs. Embed via Vidking: https://www.vidking.net/embed/movie/{tmdbId}")
     note.font = Font(size=9, color=COLOR_TEXT_DIM, name="Segoe UI", italic=True)
-    note.fill = PatternFill("solid", fgColor=COLOR_DARK_BG)
+    note.fill = dark_fill
     note.alignment = Alignment(vertical="center")
     ws.row_dimensions[note_row].height = 20
+    ws.append([note])
+
+    return ws
 
-    for row in ws.iter_rows():
-        for cell in row:
-            if not cell.fill or not cell.fill.fgColor or cell.fill.fgColor.type == "none":
-                cell.fill = PatternFill("solid", fgColor=COLOR_DARK_BG)
 
+# ── Fast path (--fast): XlsxWriter in constant_memory mode ────────────────────
+# Each row is flushed to the temp XML as soon as it is written, so memory
+# stays flat however large the sheets get. Layout and colours match the
+# openpyxl writer above; every cell shares one of a handful of Formats.
+
+XLSX_MAX_LINKS = 65530   # Excel's hyperlink limit per worksheet
+
+
+def open_fast_workbook(output_path):
+    return xlsxwriter.Workbook(output_path, {
+        "constant_memory": True,
+        "use_zip64": True,
+        # Cell text is data: never turn it into formulas, numbers or links
+        "strings_to_formulas": False,
+        "strings_to_numbers": False,
+        "strings_to_urls": False,
+    })
+
+
+def fast_format(wb, **props):
+    return wb.add_format({"font_name": "Segoe UI", "valign": "vcenter", **props})
+
+
+def write_sheet_fast(wb, sheet_name, tab_color, header_color, data_rows, headers,
+                     url_headers=None):
+    """XlsxWriter twin of write_sheet; takes the same header-ordered rows."""
+    ws = wb.add_worksheet(sheet_name)
+    ws.set_tab_color("#" + tab_color)
+    ws.freeze_panes(1, 0)
+    ws.hide_gridlines(2)
+    default_get = DEFAULT_COL_WIDTHS.get
+    for col, header in enumerate(headers):
+        ws.set_column(col, col, default_get(header, 18))
+    ws.set_default_row(22)
+
+    ws.set_row(0, 32)
+    ws.write_row(0, 0, headers, fast_format(
+        wb, bold=True, font_size=11, font_color="#" + COLOR_TEXT_LIGHT,
+        bg_color="#" + header_color, align="center", bottom=1, bottom_color="#000000"))
+
+    # (format, is_url) per column, for even and odd sheet rows
+    url_headers = url_headers or ()
+    row_formats = []
+    for bg in (COLOR_ROW_ALT, COLOR_ROW_MAIN):
+        formats = {}
+        for is_url in (False, True):
+            for wrap in (False, True):
+                props = {"font_size": 10, "bg_color": "#" + bg, "text_wrap": wrap,
+                         "font_color": "#" + (COLOR_LINK if is_url else COLOR_TEXT_LIGHT)}
+                if is_url:
+                    props["underline"] = 1
+                formats[is_url, wrap] = fast_format(wb, **props)
+        row_formats.append([(formats[h in url_headers, h == "Overview"], h in url_headers)
+                            for h in headers])
+
+    write, write_url = ws.write, ws.write_url
+    links = 0
+    row_idx = 1
+    for row_idx, values in enumerate(data_rows, 2):
+        r = row_idx - 1
+        for c, (val, (fmt, is_url)) in enumerate(zip(values, row_formats[row_idx & 1])):
+            # Past Excel's hyperlink cap, URLs stay as link-styled text
+            if is_url and val and links < XLSX_MAX_LINKS:
+                write_url(r, c, val, fmt, val)
+                links += 1
+            else:
+                write(r, c, val, fmt)
+
+    ws.autofilter(0, 0, row_idx - 1, len(headers) - 1)
+    return ws
+
+
+def write_summary_sheet_fast(wb, stats):
+    ws = wb.add_worksheet("📊 Summary")
+    ws.set_tab_color("#" + COLOR_HEADER_SUM)
+    ws.hide_gridlines(2)
+    ws.set_column(0, 0, 35)
+    ws.set_column(1, 1, 20)
+    dark_bg = "#" + COLOR_DARK_BG
+
+    ws.set_row(0, 45)
+    ws.merge_range(0, 0, 0, 1, "🎬 Cineby.gd Content Database", fast_format(
+        wb, bold=True, font_size=18, font_color="#" + COLOR_TEXT_LIGHT,
+        bg_color=dark_bg, align="center"))
+    ws.set_row(1, 22)
+    ws.merge_range(
+        1, 0, 1, 1,
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  |  Source: TMDB API + cineby.gd",
+        fast_format(wb, font_size=10, italic=True, font_color="#" + COLOR_TEXT_DIM,
+                    bg_color=dark_bg, align="center"))
+
+    rows = [
+        ("Category",        "Total Items",   COLOR_HEADER_SUM),
+        ("🎬 Movies",        stats.get("movies", 0),   None),
+        ("📺 TV Shows",      stats.get("tv_shows", 0), None),
+        ("🎌 Anime",         stats.get("anime", 0),    None),
+        ("📡 Channels",      stats.get("channels", 0), None),
+        ("━" * 20,           "━" * 10,                 None),
+        ("📦 TOTAL CONTENT", stats.get("total", 0),    COLOR_HEADER_SUM),
+    ]
+
+    label_colors = {
+        "🎬 Movies":        COLOR_HEADER_MOV,
+        "📺 TV Shows":      COLOR_HEADER_TV,
+        "🎌 Anime":         COLOR_HEADER_ANI,
+        "📡 Channels":      COLOR_HEADER_CH,
+        "📦 TOTAL CONTENT": COLOR_HEADER_SUM,
+    }
+
+    for r_idx, (label, value, force_color) in enumerate(rows, 4):
+        ws.set_row(r_idx - 1, 26)
+        bg = force_color or COLOR_ROW_ALT if r_idx % 2 == 0 else COLOR_ROW_MAIN
+        accent = label_colors.get(label)
+        props = {"bold": accent is not None, "font_size": 12 if accent else 11,
+                 "font_color": "#" + COLOR_TEXT_LIGHT, "bg_color": "#" + (accent or bg)}
+        ws.write(r_idx - 1, 0, label, fast_format(wb, align="left", **props))
+        ws.write(r_idx - 1, 1, value, fast_format(wb, align="right", **props))
+
+    note_row = len(rows) + 6
+    ws.set_row(note_row - 1, 20)
+    ws.merge_range(
+        note_row - 1, 0, note_row - 1, 1,
+        "💡 Cineby uses TMDB IDs. Embed via Vidking: https://www.vidking.net/embed/movie/{tmdbId}",
+        fast_format(wb, font_size=9, italic=True, font_color="#" + COLOR_TEXT_DIM,
+                    bg_color=dark_bg))
     return ws
 
 
@@ -636,7 +1031,7 @@ def write_summary_sheet(wb, stats):
 #  MAIN
 # ─────────────────────────────────────────────────────────────────────────────
 
-def main():
+def main(fast=False):
     print("=" * 65)
     print("  🎬 Cineby.gd Content Scraper — Powered by TMDB API")
     print(f"  Max pages   : Movies={MAX_PAGES_MOVIES or '500'}, "
@@ -657,23 +1052,47 @@ def main():
     random.seed(day_of_year)
 
     # ── Decide fetch strategy ──────────────────────────────────────────────────
-    if INCREMENTAL_UPDATE and os.path.exists(output_path):
-        print("\n📂  Loading existing data from Excel...")
-        existing_movies, ex_movie_ids     = load_existing_rows(output_path, "🎬 Movies")
-        existing_tv,     ex_tv_ids         = load_existing_rows(output_path, "📺 TV Shows")
-        existing_anime,  ex_anime_ids      = load_existing_rows(output_path, "🎌 Anime (Series)")
-        existing_animov, ex_animov_ids     = load_existing_rows(output_path, "🎌 Anime Movies")
-        existing_ch,     ex_ch_ids         = load_existing_rows(output_path, "📡 Channels",
-                                                                id_col="Network ID")
-        print(f"  ✓ Loaded: {len(existing_movies):,} movies, {len(existing_tv):,} TV, "
-              f"{len(existing_anime):,} anime series, {len(existing_animov):,} anime movies, "
-              f"{len(existing_ch):,} channels")
+    # Every scraped row lives in the SQLite store; the Excel file is rebuilt
+    # from it at the end of each run.
+    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), DB_FILE)
+    conn = store.open_store(db_path)
+    movie_urls = {"Cineby URL", "Vidking Embed", "Poster"}
+    tv_urls    = {"Cineby URL", "Cineby Ep1 URL", "Vidking Embed", "Poster"}
+    sheets = [
+        # (sheet name, colour, store table, headers, ID column, URL columns, label)
+        ("🎬 Movies",         COLOR_HEADER_MOV, "movies",       MOVIE_HEADERS,   "TMDB ID",    movie_urls, "Movies"),
+        ("📺 TV Shows",       COLOR_HEADER_TV,  "tv",           TV_HEADERS,      "TMDB ID",    tv_urls,    "TV Shows"),
+        ("🎌 Anime (Series)", COLOR_HEADER_ANI, "anime",        TV_HEADERS,      "TMDB ID",    tv_urls,    "Anime Series"),
+        ("🎌 Anime Movies",   COLOR_HEADER_ANI, "anime_movies", MOVIE_HEADERS,   "TMDB ID",    movie_urls, "Anime Movies"),
+        ("📡 Channels",       COLOR_HEADER_CH,  "channels",     CHANNEL_HEADERS, "Network ID",
+         {"Homepage", "TMDB Page", "Logo"}, "Channels"),
+    ]
+
+    if not INCREMENTAL_UPDATE:
+        store.clear(conn)
+    elif store.is_empty(conn) and os.path.exists(output_path):
+        # One-time migration: seed the store from an Excel file written
+        # before the store existed.
+        print("\n📂  Seeding content store from existing Excel...")
+        for sheet_name, _, table, headers, id_col, _, _ in sheets:
+            rows, _ = load_existing_rows(output_path, sheet_name, headers, id_col=id_col)
+            store.insert_rows(conn, table, (dict(zip(headers, r)) for r in rows), id_col=id_col)
+
+    if INCREMENTAL_UPDATE and not store.is_empty(conn):
+        print("\n📂  Loading known IDs from content store...")
+        ex_movie_ids  = store.load_ids(conn, "movies")
+        ex_tv_ids     = store.load_ids(conn, "tv")
+        ex_anime_ids  = store.load_ids(conn, "anime")
+        ex_animov_ids = store.load_ids(conn, "anime_movies")
+        ex_ch_ids     = store.load_ids(conn, "channels")
+        print(f"  ✓ Loaded: {len(ex_movie_ids):,} movies, {len(ex_tv_ids):,} TV, "
+              f"{len(ex_anime_ids):,} anime series, {len(ex_animov_ids):,} anime movies, "
+              f"{len(ex_ch_ids):,} channels")
         fetch_fn = fetch_incremental
     else:
         if INCREMENTAL_UPDATE:
-            print("  (No existing file found — running full fetch)")
-        existing_movies = existing_tv = existing_anime = existing_animov = existing_ch = []
-        ex_movie_ids = ex_tv_ids = ex_anime_ids = ex_animov_ids = ex_ch_ids = set()
+            print("  (No existing data found — running full fetch)")
+        ex_movie_ids = ex_tv_ids = ex_anime_ids = ex_animov_ids = ex_ch_ids = frozenset()
         fetch_fn = lambda client, ep, params, ex_ids, mp, desc, stop_early=True: \
             client.fetch_all_pages(ep, params=params, max_pages=mp, desc=desc)
 
@@ -747,6 +1166,7 @@ def main():
             f"  Deep Archive: {year}"
         ))
 
+    movie_jobs = []
     for ep, params, desc in endpoints:
         pages_to_fetch = 500 
         
@@ -755,16 +1175,20 @@ def main():
         is_fresh_list = any(x in desc.lower() for x in ["trending", "popular", "now playing", "upcoming", str(current_year)])
         should_stop_early = is_fresh_list # trending lists update often, check them fully
         
-        items = fetch_fn(client, ep, params, ex_movie_ids, pages_to_fetch, desc, stop_early=should_stop_early)
+        movie_jobs.append((ep, params, ex_movie_ids, pages_to_fetch, desc, should_stop_early))
+
+    for items in fetch_endpoints(fetch_fn, client, movie_jobs):
         movie_lists.extend(items)
 
-    new_movies  = dedupe(movie_lists)
-    new_mov_data = [normalize_movie(m) for m in new_movies]
-    # Merge: existing first, then new (existing rows keep their order)
-    movies_data = existing_movies + [r for r in new_mov_data
-                                     if r["TMDB ID"] not in ex_movie_ids]
+    new_mov_data = normalize_new(movie_lists, normalize_movie, ex_movie_ids)
+    # Raw TMDB payloads aren't needed once normalised — release them so they
+    # don't stay resident through the remaining fetches and the Excel build.
+    del movie_lists
+    # Merge: existing rows keep their order, new ones are appended
+    store.insert_rows(conn, "movies", new_mov_data)
+    n_movies = store.count(conn, "movies")
     print(f"  → {len(new_mov_data):,} new movies fetched, "
-          f"{len(movies_data):,} total in file")
+          f"{n_movies:,} total in file")
 
     # ── 2. TV SHOWS ─────────────────────────────────────────────────────────────────────────────
     print("\n📺  Fetching TV Shows...")
@@ -806,20 +1230,23 @@ def main():
             f"  TV Archive: {year}"
         ))
 
+    tv_jobs = []
     for ep, params, desc in tv_endpoints:
         pages_to_fetch = 500
         if "global" in desc.lower() or "popular tv" in desc.lower():
             pages_to_fetch = MAX_PAGES_TV or 500
         should_stop_early = not ("slice" in desc.lower() or "archive" in desc.lower())
-        items = fetch_fn(client, ep, params, ex_tv_ids, pages_to_fetch, desc, stop_early=should_stop_early)
+        tv_jobs.append((ep, params, ex_tv_ids, pages_to_fetch, desc, should_stop_early))
+
+    for items in fetch_endpoints(fetch_fn, client, tv_jobs):
         tv_lists.extend(items)
 
-    new_tv      = dedupe(tv_lists)
-    new_tv_data = [normalize_tv(t) for t in new_tv]
-    tv_data     = existing_tv + [r for r in new_tv_data
-                                  if r["TMDB ID"] not in ex_tv_ids]
+    new_tv_data = normalize_new(tv_lists, normalize_tv, ex_tv_ids)
+    del tv_lists
+    store.insert_rows(conn, "tv", new_tv_data)
+    n_tv = store.count(conn, "tv")
     print(f"  → {len(new_tv_data):,} new TV shows fetched, "
-          f"{len(tv_data):,} total in file")
+          f"{n_tv:,} total in file")
 
     # ── 3. ANIME ─────────────────────────────────────────────────────────────────────────────
     print("\n🎌  Fetching Anime...")
@@ -849,106 +1276,94 @@ def main():
         }, "  Anime (KR Animation)"),
     ]
 
-    for ep, params, desc in anime_endpoints:
-        items = fetch_fn(client, ep, params, ex_anime_ids, MAX_PAGES_ANIME, desc)
-        anime_lists.extend(items)
-
-    anime_movie_items = fetch_fn(
-        client,
+    anime_jobs = [(ep, params, ex_anime_ids, MAX_PAGES_ANIME, desc, True)
+                  for ep, params, desc in anime_endpoints]
+    anime_jobs.append((
         "/discover/movie",
         {"with_genres": "16", "with_origin_country": "JP",
          "sort_by": "popularity.desc", "language": "en-US"},
         ex_animov_ids, MAX_PAGES_ANIME,
-        "  Anime Movies (JP)"
-    )
+        "  Anime Movies (JP)", True,
+    ))
+
+    *anime_results, anime_movie_items = fetch_endpoints(fetch_fn, client, anime_jobs)
+    for items in anime_results:
+        anime_lists.extend(items)
 
-    new_anime_tv     = dedupe(anime_lists)
-    new_anime_tv_data = [normalize_tv(a, is_anime=True) for a in new_anime_tv]
-    all_anime_data   = existing_anime + [r for r in new_anime_tv_data
-                                         if r["TMDB ID"] not in ex_anime_ids]
+    new_anime_tv_data = normalize_new(
+        anime_lists, lambda a: normalize_tv(a, is_anime=True), ex_anime_ids)
+    del anime_lists
+    store.insert_rows(conn, "anime", new_anime_tv_data)
+    n_anime = store.count(conn, "anime")
 
-    new_anime_movies  = dedupe(anime_movie_items)
-    new_anime_mov_data = [normalize_movie(m) for m in new_anime_movies]
-    anime_movie_data  = existing_animov + [r for r in new_anime_mov_data
-                                            if r["TMDB ID"] not in ex_animov_ids]
+    new_anime_mov_data = normalize_new(anime_movie_items, normalize_movie, ex_animov_ids)
+    del anime_movie_items
+    store.insert_rows(conn, "anime_movies", new_anime_mov_data)
+    n_animov = store.count(conn, "anime_movies")
 
     print(f"  → {len(new_anime_tv_data):,} new anime series fetched, "
-          f"{len(all_anime_data):,} total")
+          f"{n_anime:,} total")
     print(f"  → {len(new_anime_mov_data):,} new anime movies fetched, "
-          f"{len(anime_movie_data):,} total")
+          f"{n_animov:,} total")
 
     # ── 4. CHANNELS / NETWORKS ────────────────────────────────────────────────────────────────
-    new_channels  = fetch_networks(client, max_pages=MAX_PAGES_CHANNELS)
-    new_ch_ids    = {c["Network ID"] for c in new_channels}
-    channels_data = existing_ch + [c for c in new_channels
-                                    if c["Network ID"] not in ex_ch_ids]
-    print(f"  → {len(new_channels):,} channels fetched, "
-          f"{len(channels_data):,} total in file")
+    new_channels  = fetch_networks(client, max_pages=MAX_PAGES_CHANNELS, existing_ids=ex_ch_ids)
+    store.insert_rows(conn, "channels", new_channels, id_col="Network ID")
+    n_channels = store.count(conn, "channels")
+    print(f"  → {len(new_channels):,} new channels fetched, "
+          f"{n_channels:,} total in file")
 
     # ── 5. BUILD EXCEL ─────────────────────────────────────────────────────────────────────────────
     print(f"\n📝  Building Excel file...")
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    largest = max(n_movies, n_tv, n_anime, n_animov, n_channels)
+    if not fast and FAST_WRITER_ROWS and largest >= FAST_WRITER_ROWS and xlsxwriter is not None:
+        # openpyxl's per-cell cost dominates on big sheets; XlsxWriter
+        # streams the worksheet XML straight to disk.
+        print(f"  ({largest:,}-row sheet — streaming with XlsxWriter)")
+        fast = True
+    if fast and xlsxwriter is None:
+        print("  [!] --fast needs XlsxWriter (pip install XlsxWriter) — using openpyxl")
+        fast = False
 
     stats = {
-        "movies":   len(movies_data),
-        "tv_shows": len(tv_data),
-        "anime":    len(all_anime_data) + len(anime_movie_data),
-        "channels": len(channels_data),
-        "total":    len(movies_data) + len(tv_data) + len(all_anime_data)
-                    + len(channels_data),
+        "movies":   n_movies,
+        "tv_shows": n_tv,
+        "anime":    n_anime + n_animov,
+        "channels": n_channels,
+        "total":    n_movies + n_tv + n_anime + n_channels,
     }
 
-    # Summary sheet (index 0)
-    write_summary_sheet(wb, stats)
+    n_rows = {"movies": n_movies, "tv": n_tv, "anime": n_anime,
+              "anime_movies": n_animov, "channels": n_channels}
 
-    # Movies sheet
-    movie_headers = [
-        "TMDB ID", "Title", "Overview", "Release Date",
-        "Rating (TMDB)", "Vote Count", "Popularity", "Language",
-        "Genres", "Cineby URL", "Vidking Embed", "Poster", "Adult",
-    ]
-    write_sheet(wb, "🎬 Movies", COLOR_HEADER_MOV, COLOR_HEADER_MOV,
-                movies_data, movie_headers,
-                url_headers={"Cineby URL", "Vidking Embed", "Poster"})
-    print(f"  ✓ Movies sheet ({len(movies_data):,} rows)")
-
-    # TV Shows sheet
-    tv_headers = [
-        "TMDB ID", "Title", "Overview", "First Air Date",
-        "Rating (TMDB)", "Vote Count", "Popularity", "Language",
-        "Genres", "Origin Country", "Cineby URL", "Cineby Ep1 URL",
-        "Vidking Embed", "Poster",
-    ]
-    write_sheet(wb, "📺 TV Shows", COLOR_HEADER_TV, COLOR_HEADER_TV,
-                tv_data, tv_headers,
-                url_headers={"Cineby URL", "Cineby Ep1 URL", "Vidking Embed", "Poster"})
-    print(f"  ✓ TV Shows sheet ({len(tv_data):,} rows)")
-
-    # Anime (TV Series) sheet
-    write_sheet(wb, "🎌 Anime (Series)", COLOR_HEADER_ANI, COLOR_HEADER_ANI,
-                all_anime_data, tv_headers,
-                url_headers={"Cineby URL", "Cineby Ep1 URL", "Vidking Embed", "Poster"})
-    print(f"  ✓ Anime Series sheet ({len(all_anime_data):,} rows)")
-
-    # Anime Movies sheet
-    write_sheet(wb, "🎌 Anime Movies", COLOR_HEADER_ANI, COLOR_HEADER_ANI,
-                anime_movie_data, movie_headers,
-                url_headers={"Cineby URL", "Vidking Embed", "Poster"})
-    print(f"  ✓ Anime Movies sheet ({len(anime_movie_data):,} rows)")
-
-    # Channels sheet
-    channel_headers = [
-        "Network ID", "Name", "Country", "Headquarters",
-        "Homepage", "TMDB Page", "Logo",
-    ]
-    write_sheet(wb, "📡 Channels", COLOR_HEADER_CH, COLOR_HEADER_CH,
-                channels_data, channel_headers,
-                url_headers={"Homepage", "TMDB Page", "Logo"})
-    print(f"  ✓ Channels sheet ({len(channels_data):,} rows)")
+    # Built next to the target and swapped in when complete, so anything
+    # reading the workbook meanwhile (the LV generator, the runner's row
+    # check) sees either the previous file or the finished new one
+    tmp_path = output_path + ".tmp"
+    if fast:
+        wb = open_fast_workbook(tmp_path)
+        write_summary_sheet_fast(wb, stats)
+    else:
+        # Write-only mode streams each sheet to the XLSX as it is built
+        # instead of holding every Cell object in memory until save.
+        wb = Workbook(write_only=True)
+        write_summary_sheet(wb, stats)
+
+    for sheet_name, color, table, headers, _, url_headers, label in sheets:
+        rows = rows_to_values(store.iter_rows(conn, table), headers)
+        if fast:
+            write_sheet_fast(wb, sheet_name, color, color, rows, headers, url_headers)
+        else:
+            write_sheet(wb, sheet_name, color, color, rows, headers, url_headers=url_headers)
+        print(f"  ✓ {label} sheet ({n_rows[table]:,} rows)")
 
     # Save
-    wb.save(output_path)
+    if fast:
+        wb.close()
+    else:
+        wb.save(tmp_path)
+    os.replace(tmp_path, output_path)
+    conn.close()
     file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
 
     print("\n" + "=" * 65)
@@ -964,4 +1379,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description="Cineby.gd content scraper (TMDB → Excel)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Write the workbook with XlsxWriter in constant-memory mode")
+    main(fast=parser.parse_args().fast)
@@ -16,15 +16,19 @@
     📡 Channels        → Homepage
 
   Re-running is SAFE — already-processed rows are skipped.
-  Progress is saved to a lightweight CSV checkpoint file every N rows,
-  and the heavy formatted Excel is written only once per sheet.
+  Each new link is appended to a lightweight CSV checkpoint as soon as it
+  is created, and the formatted output Excel is streamed out once, after every
+  sheet has been processed.
 ==========================================================================
 """
 
 import sys
 import os
+import csv
 import shutil
 import time
+from copy import copy
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Force unbuffered output so everything appears in real-time
@@ -43,9 +47,16 @@ SOURCE_EXCEL = BASE_DIR / "cineby_content.xlsx"
 OUTPUT_EXCEL = BASE_DIR / "public" / "cineby_content.xlsx"
 CHECKPOINT_DIR = BASE_DIR / "public" / "_checkpoints"
 
-# Save a lightweight CSV checkpoint every N successfully processed rows.
-# The heavy Excel is only written once per completed sheet.
-SAVE_EVERY   = 500
+# Minimum seconds between redraws of the in-place progress line
+PROGRESS_INTERVAL = 0.2
+# Links generated (and checkpointed) per batch
+LINK_BATCH   = 1000
+# Sheets processed in parallel worker processes (1 = one after another,
+# with the live progress line)
+SHEET_WORKERS = min(5, os.cpu_count() or 1)
+# Output is written with XlsxWriter (constant_memory) once a sheet has this
+# many rows and the package is installed; None = always openpyxl
+FAST_WRITER_ROWS = 5000
 
 SHEET_CONFIG = {
     "🎬 Movies":          "Vidking Embed",
@@ -71,9 +82,34 @@ def check_deps():
 
 check_deps()
 
+import openpyxl
 import pandas as pd
 from linkvertise import LinkvertiseClient
 
+try:
+    import xlsxwriter   # optional: faster, constant-memory output writer
+except ImportError:
+    xlsxwriter = None
+
+
+def read_sheet_streaming(wb, sheet_name: str) -> "pd.DataFrame":
+    """
+    Read one sheet of a read-only openpyxl workbook into an all-string
+    DataFrame ("" for blank cells). Read-only mode parses the sheet XML as
+    a stream, so no Cell objects are built for the whole sheet.
+    """
+    rows = wb[sheet_name].iter_rows(values_only=True)
+    headers = next(rows, None)
+    if headers is None:
+        return pd.DataFrame()
+    # Blanks become "" and non-strings str() as each row arrives, so the
+    # frame needs no separate fillna()/astype() passes afterwards
+    return pd.DataFrame(
+        [["" if v is None else v if v.__class__ is str else str(v) for v in row]
+         for row in rows],
+        columns=headers, dtype=object,
+    )
+
 
 def _checkpoint_path(sheet_name: str) -> Path:
     """Return the CSV checkpoint file path for a given sheet."""
@@ -90,12 +126,33 @@ def _load_checkpoint(sheet_name: str) -> dict:
     if not cp.exists():
         return {}
     try:
-        cdf = pd.read_csv(str(cp), dtype=str).fillna("")
-        return dict(zip(cdf["idx"].astype(str), cdf["lv_url"]))
+        # A run killed mid-write can leave a torn last line — drop it so it
+        # is neither loaded nor glued to the next appended row.
+        raw = cp.read_bytes()
+        if raw and not raw.endswith(b"\n"):
+            cp.write_bytes(raw[:raw.rfind(b"\n") + 1])
+        with open(cp, newline="", encoding="utf-8") as f:
+            rows = csv.reader(f)
+            next(rows, None)  # header
+            return {r[0]: r[1] for r in rows if len(r) == 2 and r[1]}
     except Exception:
         return {}
 
 
+def _open_checkpoint(sheet_name: str):
+    """
+    Open the checkpoint CSV for appending, line-buffered so every row is on
+    disk as soon as it is written. The header is only written to a new file.
+    """
+    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+    cp = _checkpoint_path(sheet_name)
+    is_new = not cp.exists() or cp.stat().st_size == 0
+    f = open(cp, "a", newline="", encoding="utf-8", buffering=1)
+    if is_new:
+        csv.writer(f).writerow(["idx", "lv_url"])
+    return f
+
+
 def _save_checkpoint(sheet_name: str, cp_data: dict):
     """Persist the checkpoint dict to a small CSV."""
     CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
@@ -135,155 +192,362 @@ def main():
     log("[✓] Linkvertise client ready")
 
     total_new = 0
-
-    for sheet_name, url_col in SHEET_CONFIG.items():
-        log(f"\n── {sheet_name} {'─' * (50 - len(sheet_name))}")
-        log(f"  Loading sheet from SOURCE...", end=" ")
-        sys.stdout.flush()
-
-        # Always load from the SOURCE excel (clean data, no partial LV columns)
+    done_sheets = {}   # sheet name → finished DataFrame, written at the end
+
+    workers = min(SHEET_WORKERS or 1, len(SHEET_CONFIG))
+    if workers > 1:
+        # Sheets are independent (own rows, own checkpoint file), so each is
+        # read and linked in its own process; output is shown per sheet as it
+        # finishes and the workbook is still written once, below.
+        log(f"\n⚙️  Processing {len(SHEET_CONFIG)} sheets on {workers} worker processes...")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_process_sheet_job, sheet_name, url_col)
+                       for sheet_name, url_col in SHEET_CONFIG.items()]
+            for fut in as_completed(futures):
+                sheet_name, df, n_new, messages = fut.result()
+                for msg, kwargs in messages:
+                    log(msg, **kwargs)
+                if df is not None:
+                    done_sheets[sheet_name] = df
+                total_new += n_new
+    else:
+        # Open each workbook once for the whole run (read-only, streamed)
+        books = _Workbooks()
         try:
-            df = pd.read_excel(str(SOURCE_EXCEL), sheet_name=sheet_name, dtype=str)
-            df = df.fillna("")
-        except Exception as e:
-            log(f"SKIP — {e}")
-            continue
+            for sheet_name, url_col in SHEET_CONFIG.items():
+                df, n_new = process_sheet(sheet_name, url_col, books, client)
+                if df is not None:
+                    done_sheets[sheet_name] = df
+                total_new += n_new
+        finally:
+            books.close()  # release the files before the output is replaced
+
+    # Heavy Excel write — only ONCE per run, streamed sheet by sheet
+    log(f"\n📝  Writing formatted output Excel...")
+    _write_output_excel(done_sheets, SOURCE_EXCEL, OUTPUT_EXCEL)
 
-        log(f"OK ({len(df):,} rows)")
+    log(f"\n{'=' * 65}")
+    log(f"  ✅  Done!  Total new LV links created: {total_new:,}")
+    log(f"  Output: {OUTPUT_EXCEL}")
+    log(f"{'=' * 65}")
 
-        if url_col not in df.columns:
-            log(f"  [!] Column '{url_col}' not found — skipping.")
-            continue
 
-        # Ensure LV column exists
-        if "Linkvertise_Link" not in df.columns:
-            df["Linkvertise_Link"] = ""
+class _Workbooks:
+    """
+    Read-only source/output workbooks, each opened on first use and shared
+    by every sheet processed in this process — a fresh read_excel() per sheet
+    would re-open the zip and re-parse its shared strings every time.
+    """
+    def __init__(self):
+        self._open = {}
 
-        # ── Load checkpoint (fast, from CSV) ──────────────────────────────────
-        cp_data = _load_checkpoint(sheet_name)
+    def get(self, path: Path):
+        wb = self._open.get(path)
+        if wb is None:
+            wb = self._open[path] = openpyxl.load_workbook(str(path), read_only=True, data_only=True)
+        return wb
 
-        # Also try to pull already-done links from the OUTPUT Excel
-        # (covers the case where output Excel was written but checkpoint deleted)
-        if not cp_data and OUTPUT_EXCEL.exists():
-            try:
-                odf = pd.read_excel(str(OUTPUT_EXCEL), sheet_name=sheet_name, dtype=str).fillna("")
-                if "Linkvertise_Link" in odf.columns:
-                    for i, lv in enumerate(odf["Linkvertise_Link"]):
-                        if lv.startswith("http"):
-                            cp_data[str(i)] = lv
-                    if cp_data:
-                        log(f"  ↩  Recovered {len(cp_data):,} links from output Excel into checkpoint.")
-                        _save_checkpoint(sheet_name, cp_data)
-            except Exception:
-                pass
+    def close(self):
+        for wb in self._open.values():
+            wb.close()
+        self._open.clear()
 
-        # Merge checkpoint back into df
-        for idx_str, lv_url in cp_data.items():
-            try:
-                df.at[int(idx_str), "Linkvertise_Link"] = lv_url
-            except Exception:
-                pass
 
-        # Determine what still needs processing
-        needs_lv_mask = (df["Linkvertise_Link"] == "") & df[url_col].str.startswith("http", na=False)
-        needs_lv = df[needs_lv_mask]
-        n_done = int((df["Linkvertise_Link"] != "").sum())
-        n_todo = len(needs_lv)
+def _process_sheet_job(sheet_name: str, url_col: str):
+    """Worker-process entry point: process one sheet, buffering its log lines."""
+    messages = []
+    books = _Workbooks()
+    try:
+        df, n_new = process_sheet(
+            sheet_name, url_col, books, LinkvertiseClient(),
+            out=lambda msg="", **kwargs: messages.append((msg, kwargs)),
+            progress=False,
+        )
+    finally:
+        books.close()
+    return sheet_name, df, n_new, messages
+
+
+def process_sheet(sheet_name: str, url_col: str, books: "_Workbooks", client,
+                  out=log, progress=True):
+    """
+    Load one sheet from the source Excel, merge in its checkpointed links and
+    create the missing ones. Returns (DataFrame or None if the sheet could
+    not be read, number of new links).
+    """
+    out(f"\n── {sheet_name} {'─' * (50 - len(sheet_name))}")
+    out(f"  Loading sheet from SOURCE...", end=" ")
 
-        log(f"  Already processed : {n_done:,}")
-        log(f"  Rows to process   : {n_todo:,}")
+    # Always load from the SOURCE excel (clean data, no partial LV columns)
+    try:
+        df = read_sheet_streaming(books.get(SOURCE_EXCEL), sheet_name)
+    except Exception as e:
+        out(f"SKIP — {e}")
+        return None, 0
 
-        if n_todo == 0:
-            log("  ✓ All rows already have Linkvertise links!")
-            # Still write the Excel sheet if this is the first time we're "done"
-            _write_excel_sheet(df, sheet_name, OUTPUT_EXCEL)
-            log(f"  ✅  Sheet '{sheet_name}' is complete in output Excel.")
-            continue
+    out(f"OK ({len(df):,} rows)")
 
-        success = 0
-        errors  = 0
-        t0 = time.time()
+    if url_col not in df.columns:
+        out(f"  [!] Column '{url_col}' not found — skipping.")
+        return df, 0
 
-        for pos, (idx, row) in enumerate(needs_lv.iterrows(), 1):
-            target_url = row[url_col]
+    # Ensure LV column exists
+    if "Linkvertise_Link" not in df.columns:
+        df["Linkvertise_Link"] = ""
 
-            # Progress line (overwrite in place)
-            elapsed = time.time() - t0
-            rate = pos / elapsed if elapsed > 0 else 0
-            eta = (n_todo - pos) / rate if rate > 0 else 0
-            print(
-                f"\r  [{pos}/{n_todo}] success={success} errors={errors}"
-                f"  {rate:.1f} links/s  ETA {eta/60:.1f}min   ",
-                end="", flush=True
-            )
+    # ── Load checkpoint (fast, from CSV) ──────────────────────────────────────
+    cp_data = _load_checkpoint(sheet_name)
 
+    # Also try to pull already-done links from the OUTPUT Excel
+    # (covers the case where output Excel was written but checkpoint deleted)
+    if not cp_data and OUTPUT_EXCEL.exists():
+        try:
+            odf = read_sheet_streaming(books.get(OUTPUT_EXCEL), sheet_name)
+            if "Linkvertise_Link" in odf.columns:
+                links = odf["Linkvertise_Link"]
+                links = links[links.str.slice(0, 4).to_numpy() == "http"]
+                cp_data = dict(zip(links.index.astype(str), links))
+                if cp_data:
+                    out(f"  ↩  Recovered {len(cp_data):,} links from output Excel into checkpoint.")
+                    _save_checkpoint(sheet_name, cp_data)
+        except Exception:
+            pass
+
+    # Merge checkpoint back into df in one vectorised assignment.
+    # Malformed or out-of-range indices (stale checkpoint) are dropped.
+    if cp_data:
+        cp_idx  = pd.to_numeric(pd.Series(list(cp_data)), errors="coerce")
+        cp_urls = pd.Series(list(cp_data.values()), dtype=object)
+        keep = cp_idx.isin(df.index)
+        df.loc[cp_idx[keep].astype("int64").to_numpy(), "Linkvertise_Link"] = cp_urls[keep].to_numpy()
+
+    # Determine what still needs processing
+    # Plain NumPy masks, each column scanned once
+    lv_empty = df["Linkvertise_Link"].to_numpy() == ""
+    url_http = df[url_col].str.slice(0, 4).to_numpy() == "http"
+    needs_lv = df.loc[lv_empty & url_http, url_col]
+    n_done = len(df) - int(lv_empty.sum())
+    n_todo = len(needs_lv)
+
+    out(f"  Already processed : {n_done:,}")
+    out(f"  Rows to process   : {n_todo:,}")
+
+    if n_todo == 0:
+        out("  ✓ All rows already have Linkvertise links!")
+        return df, 0
+
+    success = 0
+    errors  = 0
+    t0 = time.time()
+
+    # linkvertise() only builds the URL locally (no HTTP), so the cost
+    # here is per-row Python overhead. Links are made in batches of
+    # LINK_BATCH with a list comprehension; each batch is checkpointed
+    # with one writerows() call, and progress is redrawn at most every
+    # PROGRESS_INTERVAL seconds. New links go into df in one go at the end.
+    make_link = client.linkvertise
+    new_idx  = []
+    new_urls = []
+    last_draw = 0.0
+    todo_idx  = needs_lv.index.tolist()
+    todo_urls = needs_lv.tolist()
+
+    # Append-only checkpoint: one CSV line per new link, nothing rewritten
+    with _open_checkpoint(sheet_name) as cp_file:
+        write_rows = csv.writer(cp_file).writerows
+
+        for start in range(0, n_todo, LINK_BATCH):
+            batch_idx  = todo_idx[start:start + LINK_BATCH]
+            batch_urls = todo_urls[start:start + LINK_BATCH]
             try:
-                lv_url = client.linkvertise(USER_ID, target_url)
-                df.at[idx, "Linkvertise_Link"] = lv_url
-                cp_data[str(idx)] = lv_url
-                success += 1
-                total_new += 1
-            except Exception as e:
-                errors += 1
-                print(f"\n  [!] Row {idx}: {str(e)[:80]}", flush=True)
-
-            # Periodic lightweight checkpoint save (very fast — just CSV)
-            if success > 0 and success % SAVE_EVERY == 0:
-                print(f"\n  💾 Checkpoint saved ({n_done + success:,} total links)...", flush=True)
-                _save_checkpoint(sheet_name, cp_data)
+                links = [make_link(USER_ID, u) for u in batch_urls]
+            except Exception:
+                # Redo this batch row by row to isolate the failing rows
+                ok_idx, links = [], []
+                for idx, target_url in zip(batch_idx, batch_urls):
+                    try:
+                        links.append(make_link(USER_ID, target_url))
+                        ok_idx.append(idx)
+                    except Exception as e:
+                        errors += 1
+                        out(f"\n  [!] Row {idx}: {str(e)[:80]}")
+                batch_idx = ok_idx
+
+            write_rows(zip(batch_idx, links))
+            new_idx.extend(batch_idx)
+            new_urls.extend(links)
+            success += len(links)
 
+            # Progress line (overwrite in place)
+            pos = min(start + LINK_BATCH, n_todo)
+            now = time.time()
+            if progress and (now - last_draw >= PROGRESS_INTERVAL or pos == n_todo):
+                last_draw = now
+                elapsed = now - t0
+                rate = pos / elapsed if elapsed > 0 else 0
+                eta = (n_todo - pos) / rate if rate > 0 else 0
+                print(
+                    f"\r  [{pos}/{n_todo}] success={success} errors={errors}"
+                    f"  {rate:.1f} links/s  ETA {eta/60:.1f}min   ",
+                    end="", flush=True
+                )
+
+    if progress:
         print(flush=True)  # newline after the \r progress
+    if new_idx:
+        df.loc[new_idx, "Linkvertise_Link"] = new_urls
 
-        # Save final checkpoint
-        _save_checkpoint(sheet_name, cp_data)
+    out(f"  ✅  Created {success:,} new LV links ({errors} errors)")
+    return df, success
 
-        # Heavy Excel write — only ONCE per sheet completion
-        log(f"  � Writing formatted Excel sheet '{sheet_name}'...")
-        _write_excel_sheet(df, sheet_name, OUTPUT_EXCEL)
-        log(f"  ✅  Created {success:,} new LV links ({errors} errors)")
 
-    log(f"\n{'=' * 65}")
-    log(f"  ✅  Done!  Total new LV links created: {total_new:,}")
-    log(f"  Output: {OUTPUT_EXCEL}")
-    log(f"{'=' * 65}")
+def _write_output_excel(done_sheets: dict, source_path: Path, output_path: Path):
+    """
+    Rebuild the output Excel in one pass, keeping the source workbook's sheet
+    order. Processed sheets come from `done_sheets`; any other source sheet
+    (e.g. the Summary) is carried over cell by cell. A SHEET_CONFIG sheet
+    that could not be read this run is rewritten from the previous output,
+    so a transient read error never drops its links. Rows are streamed to
+    disk as they are written — with openpyxl's write-only mode, or with
+    XlsxWriter's constant_memory mode once a sheet reaches FAST_WRITER_ROWS.
+    """
+    largest = max((len(df) for df in done_sheets.values()), default=0)
+    fast = xlsxwriter is not None and bool(FAST_WRITER_ROWS) and largest >= FAST_WRITER_ROWS
+
+    # Write next to the target and swap in, so a crash mid-save never
+    # leaves a truncated output file behind.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+
+    src = openpyxl.load_workbook(str(source_path), read_only=True)
+    prev = None
+    try:
+        if fast:
+            wb = _open_fast_workbook(tmp_path)
+            write_sheet, copy_sheet = _write_excel_sheet_fast, _copy_sheet_fast
+        else:
+            wb = openpyxl.Workbook(write_only=True)
+            write_sheet, copy_sheet = _write_excel_sheet, _copy_sheet
+        for sheet_name in src.sheetnames:
+            if sheet_name in done_sheets:
+                write_sheet(wb, done_sheets[sheet_name], sheet_name)
+                continue
+            if sheet_name in SHEET_CONFIG:
+                # Could not be read this run — keep the previous output's copy
+                try:
+                    if prev is None:
+                        prev = openpyxl.load_workbook(str(output_path), read_only=True)
+                    df = read_sheet_streaming(prev, sheet_name)
+                except Exception as e:
+                    log(f"  [!] {sheet_name}: not in the previous output either ({e}) — left out.")
+                    continue
+                write_sheet(wb, df, sheet_name)
+                continue
+            copy_sheet(src[sheet_name], wb, sheet_name)
+    finally:
+        src.close()
+        if prev is not None:
+            prev.close()
+
+    if fast:
+        wb.close()
+    else:
+        wb.save(str(tmp_path))
+    os.replace(tmp_path, output_path)
+
+
+COL_WIDTHS = {
+    "TMDB ID": 10, "Network ID": 10, "Title": 36, "Name": 36,
+    "Overview": 50, "Release Date": 13, "First Air Date": 13,
+    "Rating (TMDB)": 13, "Vote Count": 11, "Popularity": 11,
+    "Language": 9, "Genres": 28, "Origin Country": 14,
+    "Poster": 14, "Backdrop": 14, "Cineby URL": 36,
+    "Cineby Ep1 URL": 38, "Vidking Embed": 42,
+    "Homepage": 38, "TMDB Page": 38, "Country": 9,
+    "Headquarters": 22, "Logo": 14, "Linkvertise_Link": 48,
+    "Adult": 8, "Is Anime": 9,
+}
+TAB_COLORS = {
+    "🎬 Movies":          "dc2626",
+    "📺 TV Shows":        "0ea5e9",
+    "🎌 Anime (Series)":  "7c3aed",
+    "🎌 Anime Movies":    "9333ea",
+    "📡 Channels":        "059669",
+}
+XLSX_MAX_LINKS = 65530   # Excel's hyperlink limit per worksheet
 
 
-def _write_excel_sheet(df: "pd.DataFrame", sheet_name: str, output_path: Path):
+def _sheet_layout(src_ws) -> dict:
     """
-    Write ONE sheet back into the Excel file without touching other sheets.
-    Uses openpyxl in append mode.
+    Sheet layout read-only mode doesn't expose (tab colour, gridlines,
+    widths, row heights, merges), taken straight from the sheet XML.
+    """
+    from xml.etree.ElementTree import iterparse
+
+    layout = {"tab_color": None, "gridlines": True, "widths": {}, "heights": {}, "merges": []}
+    ns = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+    with src_ws._get_source() as xml:
+        for _, el in iterparse(xml):
+            tag = el.tag
+            if tag == ns + "tabColor" and el.get("rgb"):
+                layout["tab_color"] = el.get("rgb")
+            elif tag == ns + "sheetView" and el.get("showGridLines") in ("0", "false"):
+                layout["gridlines"] = False
+            elif tag == ns + "col" and el.get("width"):
+                for ci in range(int(el.get("min")), int(el.get("max")) + 1):
+                    layout["widths"][ci] = float(el.get("width"))
+            elif tag == ns + "row":
+                if el.get("ht"):
+                    layout["heights"][int(el.get("r"))] = float(el.get("ht"))
+                el.clear()
+            elif tag == ns + "mergeCell":
+                layout["merges"].append(el.get("ref"))
+    return layout
+
+
+def _copy_sheet(src_ws, wb, sheet_name: str):
+    """
+    Copy a small read-only source sheet (e.g. the Summary) into a new
+    write-only sheet: values, cell styles and the sheet layout.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
 
-    Called ONCE per sheet (not every N rows), so heavy formatting is fine.
+    ws = wb.create_sheet(title=sheet_name)
+    layout = _sheet_layout(src_ws)
+    if layout["tab_color"]:
+        ws.sheet_properties.tabColor = layout["tab_color"]
+    if not layout["gridlines"]:
+        ws.sheet_view.showGridLines = False
+    for ci, width in layout["widths"].items():
+        ws.column_dimensions[get_column_letter(ci)].width = width
+    for ri, height in layout["heights"].items():
+        ws.row_dimensions[ri].height = height
+    for ref in layout["merges"]:
+        ws.merged_cells.add(ref)
+
+    for row in src_ws.iter_rows():
+        cells = []
+        for rc in row:
+            c = WriteOnlyCell(ws, value=rc.value)
+            if getattr(rc, "has_style", False):  # EmptyCell has no styles
+                c.font = rc.font
+                c.fill = rc.fill
+                c.alignment = rc.alignment
+                c.border = rc.border
+            cells.append(c)
+        ws.append(cells)
+
+
+def _write_excel_sheet(wb, df: "pd.DataFrame", sheet_name: str):
     """
-    import openpyxl
+    Stream ONE formatted sheet into the write-only workbook `wb`.
+    Write-only sheets are flushed row by row, so every sheet-level setting
+    (panes, tab colour, widths) is applied before the first append.
+    """
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
 
-    WIDTHS = {
-        "TMDB ID": 10, "Network ID": 10, "Title": 36, "Name": 36,
-        "Overview": 50, "Release Date": 13, "First Air Date": 13,
-        "Rating (TMDB)": 13, "Vote Count": 11, "Popularity": 11,
-        "Language": 9, "Genres": 28, "Origin Country": 14,
-        "Poster": 14, "Backdrop": 14, "Cineby URL": 36,
-        "Cineby Ep1 URL": 38, "Vidking Embed": 42,
-        "Homepage": 38, "TMDB Page": 38, "Country": 9,
-        "Headquarters": 22, "Logo": 14, "Linkvertise_Link": 48,
-        "Adult": 8, "Is Anime": 9,
-    }
-    TAB_COLORS = {
-        "🎬 Movies":          "dc2626",
-        "📺 TV Shows":        "0ea5e9",
-        "🎌 Anime (Series)":  "7c3aed",
-        "🎌 Anime Movies":    "9333ea",
-        "📡 Channels":        "059669",
-    }
-
-    wb = openpyxl.load_workbook(str(output_path))
-
-    # Remove old version of this sheet
-    if sheet_name in wb.sheetnames:
-        del wb[sheet_name]
-
     ws = wb.create_sheet(title=sheet_name)
     ws.freeze_panes = "A2"
     ws.sheet_view.showGridLines = False
@@ -292,47 +556,269 @@ def _write_excel_sheet(df: "pd.DataFrame", sheet_name: str, output_path: Path):
     headers = list(df.columns)
     lv_idx_1 = headers.index("Linkvertise_Link") + 1 if "Linkvertise_Link" in headers else -1
 
+    # Column widths
+    for ci, h in enumerate(headers, 1):
+        ws.column_dimensions[get_column_letter(ci)].width = COL_WIDTHS.get(h, 16)
+
     HDR_COLOR = TAB_COLORS.get(sheet_name, "1e293b")
     hdr_fill  = PatternFill("solid", fgColor=HDR_COLOR)
 
-    # Header row
-    ws.row_dimensions[1].height = 28
-    for ci, h in enumerate(headers, 1):
-        c = ws.cell(row=1, column=ci, value=h)
-        c.fill = hdr_fill
-        c.font = Font(bold=True, color="FFFFFF", size=10, name="Segoe UI")
-        c.alignment = Alignment(horizontal="center", vertical="center")
+    # Every style object is built once and shared by reference
+    HDR_FONT  = Font(bold=True, color="FFFFFF", size=10, name="Segoe UI")
+    HDR_ALIGN = Alignment(horizontal="center", vertical="center")
 
     EVEN_FILL = PatternFill("solid", fgColor="111827")
     ODD_FILL  = PatternFill("solid", fgColor="0d1117")
     LV_FILL   = PatternFill("solid", fgColor="064e3b")
 
-    # Data rows
-    for ri, row_tuple in enumerate(df.itertuples(index=False), 2):
-        ws.row_dimensions[ri].height = 18
-        base_fill = EVEN_FILL if ri % 2 == 0 else ODD_FILL
-        for ci, val in enumerate(row_tuple, 1):
-            is_lv = (ci == lv_idx_1)
-            val_str = "" if val is None or (isinstance(val, float) and val != val) else str(val)
-            c = ws.cell(row=ri, column=ci, value=val_str)
-            c.fill = LV_FILL if is_lv else base_fill
-            c.font = Font(
-                size=9, name="Segoe UI",
-                color="10b981" if is_lv else "e2e8f0",
-                underline="single" if val_str.startswith("http") else None,
-            )
-            c.alignment = Alignment(vertical="center")
-            if val_str.startswith("http"):
+    # FONTS[is_lv][is_http]
+    FONTS = (
+        (Font(size=9, name="Segoe UI", color="e2e8f0"),
+         Font(size=9, name="Segoe UI", color="e2e8f0", underline="single")),
+        (Font(size=9, name="Segoe UI", color="10b981"),
+         Font(size=9, name="Segoe UI", color="10b981", underline="single")),
+    )
+    ALIGN = Alignment(vertical="center")
+
+    # 8 style templates (row parity × LV column × link), stamped onto the
+    # data cells the same way as cineby_scraper.data_row_styles.
+    # STYLES[sheet row parity][is_lv][is_http], parity 0 = even row
+    def template(fill, font):
+        c = WriteOnlyCell(ws)
+        c.fill = fill
+        c.font = font
+        c.alignment = ALIGN
+        return c._style
+
+    STYLES = tuple(
+        tuple(tuple(template(LV_FILL if is_lv else row_fill, FONTS[is_lv][is_http])
+                    for is_http in (False, True))
+              for is_lv in (False, True))
+        for row_fill in (EVEN_FILL, ODD_FILL)
+    )
+
+    # Header row
+    ws.row_dimensions[1].height = 28
+    hdr_cells = []
+    for h in headers:
+        c = WriteOnlyCell(ws, value=h)
+        c.fill = hdr_fill
+        c.font = HDR_FONT
+        c.alignment = HDR_ALIGN
+        hdr_cells.append(c)
+    ws.append(hdr_cells)
+
+    rows, http_rows = _string_rows(df)
+    row_dims = ws.row_dimensions
+    append   = ws.append
+    ri = 1
+    for ri, (row, http_row) in enumerate(zip(rows, http_rows), 2):
+        row_dims[ri].height = 18
+        styles = STYLES[ri & 1]
+        cells = []
+        for ci, (val_str, is_http) in enumerate(zip(row, http_row), 1):
+            c = WriteOnlyCell(ws, value=val_str)
+            c._style = copy(styles[ci == lv_idx_1][is_http])
+            if is_http:
                 c.hyperlink = val_str
+            cells.append(c)
+        append(cells)
 
-    # Column widths
-    for ci, h in enumerate(headers, 1):
-        ws.column_dimensions[get_column_letter(ci)].width = WIDTHS.get(h, 16)
+    ws.auto_filter.ref = f"A1:{get_column_letter(max(len(headers), 1))}{ri}"
+
+
+def _string_rows(df: "pd.DataFrame"):
+    """
+    The frame as row lists of plain strings, plus a matching per-cell
+    "is a link" flag. Coercing the whole frame once means the cell loops
+    need no per-value NaN/None checks or startswith() calls.
+    """
+    frame = df.fillna("").astype(str)
+    rows = frame.to_numpy().tolist()
+    http_rows = (frame.apply(lambda col: col.str.startswith("http")).to_numpy().tolist()
+                 if len(frame.columns) else [[]] * len(rows))
+    return rows, http_rows
+
+
+# ── XlsxWriter twins (constant_memory) ────────────────────────────────────────
+
+def _open_fast_workbook(output_path: Path):
+    return xlsxwriter.Workbook(str(output_path), {
+        "constant_memory": True,
+        "use_zip64": True,
+        # Cell text is data: never turn it into formulas, numbers or links
+        "strings_to_formulas": False,
+        "strings_to_numbers": False,
+        "strings_to_urls": False,
+    })
+
+
+def _write_excel_sheet_fast(wb, df: "pd.DataFrame", sheet_name: str):
+    """XlsxWriter twin of _write_excel_sheet — same look, formats built once."""
+    ws = wb.add_worksheet(sheet_name)
+    ws.freeze_panes(1, 0)
+    ws.hide_gridlines(2)
+    ws.set_tab_color("#" + TAB_COLORS.get(sheet_name, "334155"))
+
+    headers = list(df.columns)
+    lv_idx = headers.index("Linkvertise_Link") if "Linkvertise_Link" in headers else -1
+
+    for ci, h in enumerate(headers):
+        ws.set_column(ci, ci, COL_WIDTHS.get(h, 16))
+    ws.set_default_row(18)
+
+    ws.set_row(0, 28)
+    ws.write_row(0, 0, headers, wb.add_format({
+        "font_name": "Segoe UI", "font_size": 10, "bold": True, "font_color": "#FFFFFF",
+        "bg_color": "#" + TAB_COLORS.get(sheet_name, "1e293b"),
+        "align": "center", "valign": "vcenter",
+    }))
+
+    # FORMATS[row parity][is_lv][is_http], row parity 0 = even sheet row
+    FORMATS = []
+    for row_bg in ("111827", "0d1117"):
+        by_lv = []
+        for is_lv in (False, True):
+            by_http = []
+            for is_http in (False, True):
+                props = {
+                    "font_name": "Segoe UI", "font_size": 9, "valign": "vcenter",
+                    "font_color": "#" + ("10b981" if is_lv else "e2e8f0"),
+                    "bg_color": "#" + ("064e3b" if is_lv else row_bg),
+                }
+                if is_http:
+                    props["underline"] = 1
+                by_http.append(wb.add_format(props))
+            by_lv.append(by_http)
+        FORMATS.append(by_lv)
+
+    write, write_url, write_blank = ws.write_string, ws.write_url, ws.write_blank
+    rows, http_rows = _string_rows(df)
+    links = 0
+    r = 0
+    for r, (row, http_row) in enumerate(zip(rows, http_rows), 1):
+        # Sheet row r + 1: even sheet rows sit at odd indices here
+        formats = FORMATS[r & 1 == 0]
+        for ci, (val_str, is_http) in enumerate(zip(row, http_row)):
+            fmt = formats[ci == lv_idx][is_http]
+            # Past Excel's hyperlink cap, URLs stay as link-styled text
+            if is_http and links < XLSX_MAX_LINKS:
+                write_url(r, ci, val_str, fmt, val_str)
+                links += 1
+            elif val_str:
+                write(r, ci, val_str, fmt)
+            else:
+                write_blank(r, ci, None, fmt)
+
+    ws.autofilter(0, 0, r, max(len(headers), 1) - 1)
+
+
+def _copy_sheet_fast(src_ws, wb, sheet_name: str):
+    """
+    XlsxWriter twin of _copy_sheet. Cell styles are translated to formats
+    once per distinct source style; merged ranges are written when their
+    first row is reached, as constant_memory only moves forward.
+    """
+    from openpyxl.utils import range_boundaries
+
+    ws = wb.add_worksheet(sheet_name)
+    layout = _sheet_layout(src_ws)
+    if layout["tab_color"]:
+        ws.set_tab_color("#" + layout["tab_color"][-6:])
+    if not layout["gridlines"]:
+        ws.hide_gridlines(2)
+    for ci, width in layout["widths"].items():
+        ws.set_column(ci - 1, ci - 1, width)
+
+    # first row → [(first col, last row, last col)], all 1-based
+    merges = {}
+    for ref in layout["merges"]:
+        min_col, min_row, max_col, max_row = range_boundaries(ref)
+        merges.setdefault(min_row, []).append((min_col, max_row, max_col))
+    covered = set()
+
+    formats = {}   # source style array → xlsxwriter format
+
+    def cell_format(rc):
+        if not getattr(rc, "has_style", False):  # EmptyCell has no styles
+            return None
+        key = tuple(rc.style_array)
+        if key not in formats:
+            formats[key] = wb.add_format(_format_props(rc))
+        return formats[key]
+
+    # Rows and cells are positional: read-only mode pads gaps with EmptyCell,
+    # which carries no coordinates
+    heights = layout["heights"]
+    for ri, row in enumerate(src_ws.iter_rows(), 1):
+        if ri in heights:
+            ws.set_row(ri - 1, heights[ri])
+        for min_col, max_row, max_col in merges.get(ri, ()):
+            rc = row[min_col - 1] if min_col <= len(row) else None
+            ws.merge_range(ri - 1, min_col - 1, max_row - 1, max_col - 1,
+                           getattr(rc, "value", None), cell_format(rc))
+            covered.update((r, c) for r in range(ri, max_row + 1)
+                           for c in range(min_col, max_col + 1))
+        for ci, rc in enumerate(row, 1):
+            if (ri, ci) in covered:
+                continue
+            fmt = cell_format(rc)
+            if rc.value is None:
+                if fmt is not None:
+                    ws.write_blank(ri - 1, ci - 1, None, fmt)
+            else:
+                ws.write(ri - 1, ci - 1, rc.value, fmt)
+
+
+_BORDER_STYLES = {
+    "thin": 1, "medium": 2, "dashed": 3, "dotted": 4, "thick": 5,
+    "double": 6, "hair": 7,
+}
 
-    ws.auto_filter.ref = ws.dimensions
 
-    wb.save(str(output_path))
-    wb.close()
+def _format_props(rc) -> dict:
+    """XlsxWriter format properties for an openpyxl cell's style."""
+    def rgb(color):
+        value = getattr(color, "rgb", None)
+        return "#" + value[-6:] if isinstance(value, str) else None
+
+    props = {}
+    font = rc.font
+    if font.name:
+        props["font_name"] = font.name
+    if font.sz:
+        props["font_size"] = font.sz
+    if font.b:
+        props["bold"] = True
+    if font.i:
+        props["italic"] = True
+    if font.u:
+        props["underline"] = 1
+    if rgb(font.color):
+        props["font_color"] = rgb(font.color)
+
+    fill = rc.fill
+    if getattr(fill, "fill_type", None) == "solid" and rgb(fill.fgColor):
+        props["bg_color"] = rgb(fill.fgColor)
+
+    align = rc.alignment
+    if align.horizontal:
+        props["align"] = align.horizontal
+    if align.vertical:
+        props["valign"] = "vcenter" if align.vertical == "center" else align.vertical
+    if align.wrap_text:
+        props["text_wrap"] = True
+
+    for side in ("left", "right", "top", "bottom"):
+        edge = getattr(rc.border, side)
+        if edge is not None and edge.style in _BORDER_STYLES:
+            props[side] = _BORDER_STYLES[edge.style]
+            if rgb(edge.color):
+                props[side + "_color"] = rgb(edge.color)
+
+    if rc.number_format and rc.number_format != "General":
+        props["num_format"] = rc.number_format
+    return props
 
 
 if __name__ == "__main__":
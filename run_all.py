@@ -29,14 +29,36 @@
 
 import sys
 import os
+import re
 import json
+import shutil
+import hashlib
+import zipfile
 import subprocess
+import select
+import signal
+import socket
 import argparse
 import webbrowser
 import time
 import threading
 from pathlib import Path
+from collections import defaultdict
 from datetime import datetime, timedelta
+from xml.etree.ElementTree import iterparse
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
 
 BASE            = Path(__file__).parent
 SOURCE_EXCEL    = BASE / "cineby_content.xlsx"
@@ -45,101 +67,196 @@ ROW_COUNT_FILE  = CHECKPOINT_DIR / "row_counts.json"
 
 CHECK_INTERVAL_HOURS = 12   # default; overridable via --interval
 
+# Inherited by every script we run — set once instead of copying the
+# environment for each child
+os.environ.setdefault("PYTHONUNBUFFERED", "1")
+
 # ── Colour helpers ────────────────────────────────────────────────────────────
-GREEN  = "\033[92m"
-YELLOW = "\033[93m"
-RED    = "\033[91m"
-CYAN   = "\033[96m"
-MAGENTA= "\033[95m"
-BOLD   = "\033[1m"
-DIM    = "\033[2m"
-RESET  = "\033[0m"
+# Colour only on a terminal, and never when NO_COLOR is set (no-color.org) —
+# log files under systemd / Docker / nohup get plain text
+if sys.stdout.isatty() and not os.environ.get("NO_COLOR"):
+    GREEN  = "\033[92m"
+    YELLOW = "\033[93m"
+    RED    = "\033[91m"
+    CYAN   = "\033[96m"
+    MAGENTA= "\033[95m"
+    BOLD   = "\033[1m"
+    DIM    = "\033[2m"
+    RESET  = "\033[0m"
+else:
+    GREEN = YELLOW = RED = CYAN = MAGENTA = BOLD = DIM = RESET = ""
+
+# Flush on every newline instead of per print(flush=True) call: the output
+# still lands in order with the child scripts' output, even in a log file
+try:
+    sys.stdout.reconfigure(line_buffering=True)
+except AttributeError:
+    pass  # stdout replaced by something that isn't a text stream
+
+_SUCCESS = f"{GREEN}  ✅  "
+_WARN    = f"{YELLOW}  ⚠   "
+_ERROR   = f"{RED}  ✗   "
+_DIM     = f"{DIM}  "
 
 def banner(text, color=CYAN):
-    width = 65
-    print(f"\n{color}{BOLD}{'═' * width}")
-    print(f"  {text}")
-    print(f"{'═' * width}{RESET}\n")
+    rule = "═" * 65
+    print(f"\n{color}{BOLD}{rule}\n  {text}\n{rule}{RESET}\n")
 
 def step_header(n, total, title):
-    print(f"\n{BOLD}{CYAN}[{n}/{total}] {title}{RESET}")
-    print(f"{'─' * 60}")
+    print(f"\n{BOLD}{CYAN}[{n}/{total}] {title}{RESET}\n{'─' * 60}")
 
-def success(msg): print(f"{GREEN}  ✅  {msg}{RESET}", flush=True)
-def warn(msg):    print(f"{YELLOW}  ⚠   {msg}{RESET}", flush=True)
-def error(msg):   print(f"{RED}  ✗   {msg}{RESET}", flush=True)
-def info(msg):    print(f"      {msg}", flush=True)
-def dim(msg):     print(f"{DIM}  {msg}{RESET}", flush=True)
+def success(msg): print(f"{_SUCCESS}{msg}{RESET}")
+def warn(msg):    print(f"{_WARN}{msg}{RESET}")
+def error(msg):   print(f"{_ERROR}{msg}{RESET}")
+def info(msg):    print(f"      {msg}")
+def dim(msg):     print(f"{_DIM}{msg}{RESET}")
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Row-count state  (stored in public/_checkpoints/row_counts.json)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _load_row_counts() -> dict:
-    """Load previously saved row counts per sheet."""
-    if ROW_COUNT_FILE.exists():
-        try:
-            return json.loads(ROW_COUNT_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return {}
+def _load_row_counts() -> tuple[dict, dict | None]:
+    """
+    Load previously saved row counts per sheet, plus the signature of the
+    Excel file they were counted from (None for older snapshots).
+    """
+    try:
+        data = _json_loads(ROW_COUNT_FILE.read_bytes())
+    except (OSError, ValueError):   # missing (FileNotFoundError) or corrupt
+        return {}, None
+    if not isinstance(data, dict):
+        return {}, None
+    if "counts" in data:
+        return data["counts"], data.get("signature")
+    return data, None   # old format: just {sheet: count}
 
 
-def _save_row_counts(counts: dict):
+def _save_row_counts(counts: dict, signature: dict | None = None):
     CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
-    ROW_COUNT_FILE.write_text(
-        json.dumps(counts, indent=2, ensure_ascii=False),
-        encoding="utf-8"
-    )
+    # Write next to the target and swap in, so an interrupted write never
+    # leaves a truncated snapshot behind.
+    tmp_path = ROW_COUNT_FILE.with_name(ROW_COUNT_FILE.name + ".tmp")
+    tmp_path.write_bytes(_json_dumps({"signature": signature, "counts": counts}))
+    os.replace(tmp_path, ROW_COUNT_FILE)
+
+
+def _file_signature(path: Path) -> dict:
+    """(mtime, size) of a file — changes whenever the scraper rewrites it."""
+    st = path.stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+_NS_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_REL  = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_PKG  = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_DIMENSION_ROW_RE = re.compile(r"[A-Z]+(\d+)$")
+
+
+def _sheet_parts(zf: zipfile.ZipFile) -> list[tuple[str, str]]:
+    """[(sheet name, worksheet XML part)] in workbook order."""
+    with zf.open("xl/_rels/workbook.xml.rels") as f:
+        targets = {el.get("Id"): el.get("Target")
+                   for _, el in iterparse(f) if el.tag == _NS_PKG + "Relationship"}
+    parts = []
+    with zf.open("xl/workbook.xml") as f:
+        for _, el in iterparse(f):
+            if el.tag == _NS_MAIN + "sheet":
+                target = targets[el.get(_NS_REL + "id")]
+                part = target.lstrip("/") if target.startswith("/") else "xl/" + target
+                parts.append((el.get("name"), part))
+    return parts
+
+
+def _sheet_row_count(zf: zipfile.ZipFile, part: str) -> int:
+    """
+    Last used row of one worksheet, read from its <dimension ref="A1:N961"/>
+    tag at the top of the XML. Only when that is missing (or just "A1") are
+    the <row> elements counted.
+    """
+    with zf.open(part) as f:
+        last_row = 0
+        for event, el in iterparse(f, events=("start", "end")):
+            tag = el.tag
+            if event == "start":
+                if tag == _NS_MAIN + "dimension":
+                    m = _DIMENSION_ROW_RE.search(el.get("ref", ""))
+                    if m and ":" in el.get("ref"):
+                        return int(m.group(1))
+                elif tag == _NS_MAIN + "row":
+                    last_row = int(el.get("r") or last_row + 1)
+            elif tag == _NS_MAIN + "row":
+                el.clear()
+        return last_row
+
+
+def _sheets_digest(zf: zipfile.ZipFile) -> str:
+    """
+    Digest of the CRC32s the zip's central directory already holds for the
+    workbook and worksheet parts — nothing is decompressed.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for zi in zf.infolist():
+        name = zi.filename
+        if name.startswith(("xl/workbook.xml", "xl/_rels/workbook.xml", "xl/worksheets/sheet")):
+            h.update(f"{name}:{zi.CRC:08x}:{zi.file_size};".encode())
+    return h.hexdigest()
 
 
-def _count_excel_rows(path: Path) -> dict:
+def _count_excel_rows(path: Path, cached_counts: dict | None = None,
+                      cached_signature: dict | None = None) -> tuple[dict, dict | None]:
     """
-    Return {sheet_name: row_count} for all sheets in the Excel file.
-    Uses openpyxl in read-only mode so it's fast even on large files.
+    Return ({sheet_name: row_count}, file signature) for all sheets in the
+    Excel file. Reads the sheet dimensions straight from the xlsx zip — no
+    shared strings, styles or cells are loaded. `cached_counts` is returned
+    instead when the file is untouched since `cached_signature` (same mtime
+    and size), or was rewritten with identical sheets (same CRC digest).
     """
     try:
-        import openpyxl
-        wb = openpyxl.load_workbook(str(path), read_only=True, data_only=True)
-        counts = {}
-        for name in wb.sheetnames:
-            ws = wb[name]
-            # max_row includes the header, subtract 1 for data rows
-            counts[name] = max(0, (ws.max_row or 1) - 1)
-        wb.close()
-        return counts
+        signature = _file_signature(path)
+        cached_signature = cached_signature or {}
+        if cached_counts and signature.items() <= cached_signature.items():
+            return dict(cached_counts), cached_signature
+        with zipfile.ZipFile(path) as zf:
+            signature["digest"] = _sheets_digest(zf)
+            if cached_counts and signature["digest"] == cached_signature.get("digest"):
+                dim("Workbook rewritten with identical sheets — row counts reused.")
+                return dict(cached_counts), signature
+            # the dimension includes the header, subtract 1 for data rows
+            return {name: max(0, _sheet_row_count(zf, part) - 1)
+                    for name, part in _sheet_parts(zf)}, signature
     except Exception as e:
         warn(f"Could not read row counts from Excel: {e}")
-        return {}
+        return {}, None
 
 
-def detect_new_rows(path: Path) -> tuple[bool, dict, dict]:
+def detect_new_rows(path: Path) -> tuple[bool, dict, dict, dict | None, int]:
     """
     Compare current row counts with the saved snapshot.
 
     Returns:
-        (has_new_rows, old_counts, new_counts)
+        (has_new_rows, old_counts, new_counts, file_signature, total_new_rows)
     """
-    old_counts = _load_row_counts()
-    new_counts = _count_excel_rows(path)
+    old_counts, old_signature = _load_row_counts()
+    new_counts, signature = _count_excel_rows(path, old_counts, old_signature)
 
     if not old_counts:
         # First run — treat as "new data" so LV runs at least once
         info("No previous row snapshot found → treating as new data.")
-        return True, old_counts, new_counts
+        return True, old_counts, new_counts, signature, sum(new_counts.values())
 
-    has_new = False
+    total_new = 0
+    prev_counts = defaultdict(int, old_counts)   # sheets new since the snapshot start at 0
     for sheet, count in new_counts.items():
-        prev = old_counts.get(sheet, 0)
+        prev = prev_counts[sheet]
         if count > prev:
             diff = count - prev
             info(f"  📈  {sheet}: {prev:,} → {count:,}  (+{diff:,} new rows)")
-            has_new = True
+            total_new += diff
         else:
             dim(f"  {sheet}: {count:,} rows (no change)")
 
-    return has_new, old_counts, new_counts
+    return total_new > 0, old_counts, new_counts, signature, total_new
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -155,67 +272,161 @@ def run_script(script_name: str, description: str) -> bool:
 
     info(f"Running: {script_path}")
     try:
-        result = subprocess.run(
-            [sys.executable, "-u", str(script_path)],
-            cwd=str(BASE),
-            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        # The child inherits os.environ as is (no per-run copy) and gets its
+        # own process group, so Ctrl+C and SIGTERM are forwarded to it
+        # deliberately below
+        proc = subprocess.Popen(
+            [sys.executable, "-u", script_path],
+            cwd=BASE,
+            start_new_session=True,
         )
-        if result.returncode != 0:
-            error(f"{description} exited with code {result.returncode}")
+        try:
+            # _wait() returns on SIGCHLD and SIGTERM, or after a second at most
+            while proc.poll() is None:
+                if _stop_requested:
+                    _interrupt_group(proc, signal.SIGTERM)
+                    warn(f"{description} stopped (SIGTERM).")
+                    return False
+                _wait(1.0)
+            returncode = proc.returncode
+        except KeyboardInterrupt:
+            _interrupt_group(proc)
+            warn(f"{description} interrupted by user.")
+            return False
+        if returncode != 0:
+            error(f"{description} exited with code {returncode}")
             return False
         success(f"{description} completed successfully.")
         return True
-    except KeyboardInterrupt:
-        warn(f"{description} interrupted by user.")
-        return False
     except Exception as e:
         error(f"{description} failed: {e}")
         return False
 
 
+def _interrupt_group(proc: subprocess.Popen, sig: int = signal.SIGINT, timeout: float = 10):
+    """
+    Pass Ctrl+C (or `sig`) on to a child started in its own session (and
+    everything it spawned), giving it `timeout` seconds to clean up before
+    it is killed.
+    """
+    if os.name != "nt":  # on Windows the child shares the console's Ctrl+C
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            return
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 #  Web app (runs persistently in background)
 # ─────────────────────────────────────────────────────────────────────────────
 
 _webapp_proc: subprocess.Popen | None = None
 
+# Resolved once, and run directly rather than through a shell (on Windows
+# npm is a .cmd shim)
+NPM_CMD = shutil.which("npm.cmd" if os.name == "nt" else "npm")
+
+WEBAPP_PORT = 5173   # Vite's dev server port
+WEBAPP_URL  = f"http://localhost:{WEBAPP_PORT}"
+WEBAPP_MIN_UPTIME = 30   # seconds; see check_webapp()
+_webapp_started = 0.0    # monotonic time of the last launch
+
 def start_webapp(open_browser: bool = True):
     """Launch Vite dev server in background (non-blocking)."""
-    global _webapp_proc
+    global _webapp_proc, _webapp_started
     if _webapp_proc and _webapp_proc.poll() is None:
         dim("Web server is already running.")
         return
 
+    if not NPM_CMD:
+        error("npm not found on PATH — install Node.js to run the web server.")
+        return
+
     info("Starting Vite dev server (background)…")
     try:
+        # Own process group, so stop_webapp() can stop npm, node and Vite's
+        # workers together
+        if os.name == "nt":
+            group = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {"start_new_session": True}
+        _webapp_started = time.monotonic()
         _webapp_proc = subprocess.Popen(
-            ["npm", "run", "dev"],
-            # ["npm", "run", "preview", "--", "--host", "0.0.0.0", "--port", os.environ.get("PORT", "8080")],
-            cwd=str(BASE),
-            shell=True,      # required on Windows for npm
-            env={**os.environ},
+            [NPM_CMD, "run", "dev"],
+            # [NPM_CMD, "run", "preview", "--", "--host", "0.0.0.0", "--port", os.environ.get("PORT", "8080")],
+            cwd=BASE,
+            **group,
         )
         info(f"Web server PID: {_webapp_proc.pid}")
 
         if open_browser:
-            def _open():
-                time.sleep(4)
-                webbrowser.open("http://localhost:5173")
-            threading.Thread(target=_open, daemon=True).start()
+            threading.Thread(target=_open_when_ready, args=(_webapp_proc,), daemon=True).start()
 
-        success("Web server started → http://localhost:5173")
+        success(f"Web server started → {WEBAPP_URL}")
     except Exception as e:
         error(f"Failed to start web server: {e}")
 
 
+def check_webapp() -> float | None:
+    """
+    Restart the web server if it exited on its own. One that dies within
+    WEBAPP_MIN_UPTIME of starting is only respawned once that long has passed
+    since its launch, instead of in a tight loop. Returns the seconds until
+    that delayed restart is due, or None if there is none to wait for.
+    """
+    if _webapp_proc is None or _webapp_proc.poll() is None:
+        return None
+    code = _webapp_proc.returncode
+    delay = _webapp_started + WEBAPP_MIN_UPTIME - time.monotonic()
+    if delay > 0:
+        warn(f"Web server exited right after starting (exit={code}); retrying in {delay:.0f}s.")
+        return delay
+    warn(f"Web server died (exit={code}), restarting…")
+    start_webapp(open_browser=False)
+    return None
+
+
+def _open_when_ready(proc: subprocess.Popen, timeout: float = 15):
+    """Open the browser as soon as the dev server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and proc.poll() is None:
+        try:
+            socket.create_connection(("localhost", WEBAPP_PORT), timeout=0.1).close()
+        except OSError:
+            time.sleep(0.25)
+            continue
+        webbrowser.open(WEBAPP_URL)
+        return
+
+
+def _signal_webapp(sig):
+    """Send `sig` to the web server's whole process group."""
+    try:
+        if os.name == "nt":
+            _webapp_proc.send_signal(sig)
+        else:
+            os.killpg(_webapp_proc.pid, sig)
+    except (ProcessLookupError, OSError):
+        pass  # already gone
+
+
 def stop_webapp():
     global _webapp_proc
     if _webapp_proc and _webapp_proc.poll() is None:
-        _webapp_proc.terminate()
+        _signal_webapp(signal.CTRL_BREAK_EVENT if os.name == "nt" else signal.SIGTERM)
         try:
             _webapp_proc.wait(timeout=5)
         except subprocess.TimeoutExpired:
-            _webapp_proc.kill()
+            if os.name == "nt":
+                _webapp_proc.kill()
+            else:
+                _signal_webapp(signal.SIGKILL)
+            _webapp_proc.wait()
         _webapp_proc = None
         dim("Web server stopped.")
 
@@ -237,6 +448,8 @@ def run_pipeline_cycle(args) -> None:
     now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     banner(f"CinebyHub — Pipeline Cycle  [{now_str}]")
 
+    check_webapp()
+
     step = 1
     total_steps = 2  # scrape + (maybe) LV
 
@@ -262,7 +475,7 @@ def run_pipeline_cycle(args) -> None:
         return
 
     print(f"\n{CYAN}  🔍  Checking for new content rows…{RESET}")
-    has_new, old_counts, new_counts = detect_new_rows(SOURCE_EXCEL)
+    has_new, _, new_counts, signature, total_new_rows = detect_new_rows(SOURCE_EXCEL)
 
     # ── Step 2: Linkvertise Generator ────────────────────────────────────────
     step_header(step, total_steps, "Linkvertise Link Generator")
@@ -271,10 +484,6 @@ def run_pipeline_cycle(args) -> None:
         if args.force_lv and not has_new:
             info("--force-lv flag set — skipping (no longer needed).")
         else:
-            total_new_rows = sum(
-                max(0, new_counts.get(s, 0) - old_counts.get(s, 0))
-                for s in new_counts
-            )
             info(f"  🆕  {total_new_rows:,} new rows detected!")
         
         # Linkvertise links are now generated on-the-fly in the frontend!
@@ -282,35 +491,132 @@ def run_pipeline_cycle(args) -> None:
         success("Skipping Linkvertise generator (now handled in frontend).")
         
         # Save updated counts
-        _save_row_counts(new_counts)
+        _save_row_counts(new_counts, signature)
     else:
         success("No new content rows found.")
         # Still update the baseline (counts haven't changed, but timestamp matters)
-        _save_row_counts(new_counts)
+        _save_row_counts(new_counts, signature)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Countdown display
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _countdown(wake_at: datetime):
-    """Show a live countdown until next scheduled run (updates every minute)."""
+# Set on SIGTERM (docker stop, systemd) to request a clean shutdown. Signal
+# handlers only set this flag: they run on the main thread, which may be
+# inside the very lock a threading.Event would need.
+_stop_requested = False
+# Read end of a self-pipe registered with signal.set_wakeup_fd(): every
+# caught signal (SIGTERM, or SIGCHLD when a child exits) writes a byte to it,
+# which wakes _wait(). None on Windows, where _wait() polls instead.
+_wake_fd = None
+
+
+def _request_stop(*_):
+    global _stop_requested
+    _stop_requested = True
+
+
+def _install_signal_handlers():
+    """Route SIGTERM to _request_stop() and make signals wake _wait()."""
+    global _wake_fd
+    signal.signal(signal.SIGTERM, _request_stop)
+    if not hasattr(signal, "SIGCHLD"):
+        return
+    # POSIX: notice a crashed web server right away. The handler itself does
+    # nothing; SIGCHLD is ignored by default and needs one to reach the pipe.
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+    r, w = os.pipe()
+    os.set_blocking(r, False)
+    os.set_blocking(w, False)
+    signal.set_wakeup_fd(w, warn_on_full_buffer=False)
+    _wake_fd = r
+
+
+def _wait(seconds: float | None = None) -> bool:
+    """
+    Block for `seconds` (None = forever) or until a signal arrives.
+    Returns True if woken.
+    """
+    if _wake_fd is not None:
+        ready, _, _ = select.select([_wake_fd], [], [], seconds)
+        if not ready:
+            return False
+        try:
+            while os.read(_wake_fd, 512):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+    # No wakeup pipe — poll the stop flag in short slices (which also keeps
+    # Ctrl+C responsive on Windows)
+    end = None if seconds is None else time.monotonic() + seconds
+    while not _stop_requested:
+        left = 1.0 if end is None else min(1.0, end - time.monotonic())
+        if left <= 0:
+            return False
+        time.sleep(left)
+    return True
+
+
+def _idle(seconds: float | None = None) -> bool:
+    """
+    Sleep for `seconds` (None = until stopped), restarting the web server
+    as soon as it dies, or once WEBAPP_MIN_UPTIME allows if it died straight
+    after starting. Returns True if a stop was requested.
+    """
+    end = None if seconds is None else time.monotonic() + seconds
+    retry_at = None
+    while True:
+        if _stop_requested:
+            return True
+        now = time.monotonic()
+        if end is not None and now >= end:
+            return False
+        left = None if end is None else end - now
+        if retry_at is not None:
+            left = retry_at - now if left is None else min(left, retry_at - now)
+        woken = _wait(max(0.0, left) if left is not None else None)
+        if _stop_requested:
+            return True
+        if woken or (retry_at is not None and time.monotonic() >= retry_at):
+            delay = check_webapp()
+            retry_at = None if delay is None else time.monotonic() + delay
+
+
+def _countdown(wake_at: datetime, done: threading.Event):
+    """Show a live countdown until `wake_at` (repainted every minute) until `done` is set."""
+    while True:
+        remaining = max(0, int((wake_at - datetime.now()).total_seconds()))
+        h, rem = divmod(remaining, 3600)
+        m = rem // 60
+        print(
+            f"\r{DIM}  ⏰  Next check in {h}h {m:02d}m  "
+            f"(at {wake_at.strftime('%H:%M:%S')})   {RESET}",
+            end="", flush=True
+        )
+        if done.wait(60):
+            break
+
+
+def _sleep_until(wake_at: datetime) -> bool:
+    """
+    Sleep until the next scheduled run. The countdown line is only drawn on
+    a terminal — in log files (systemd, Docker) it would just pile up.
+    Returns True if a stop was requested meanwhile.
+    """
+    done = threading.Event()
+    painter = None
+    if sys.stdout.isatty():
+        painter = threading.Thread(target=_countdown, args=(wake_at, done), daemon=True)
+        painter.start()
     try:
-        while True:
-            remaining = wake_at - datetime.now()
-            if remaining.total_seconds() <= 0:
-                break
-            h, rem = divmod(int(remaining.total_seconds()), 3600)
-            m = rem // 60
-            print(
-                f"\r{DIM}  ⏰  Next check in {h}h {m:02d}m  "
-                f"(at {wake_at.strftime('%H:%M:%S')})   {RESET}",
-                end="", flush=True
-            )
-            time.sleep(30)
-        print()  # newline
-    except KeyboardInterrupt:
-        raise
+        return _idle(max(0.0, (wake_at - datetime.now()).total_seconds()))
+    finally:
+        done.set()
+        if painter:
+            painter.join(1)
+            print()  # newline after the countdown
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -345,6 +651,8 @@ Examples:
                         metavar="HOURS",  help=f"Hours between checks (default: {CHECK_INTERVAL_HOURS})")
     args = parser.parse_args()
 
+    _install_signal_handlers()
+
     banner("CinebyHub — Master Pipeline Runner")
 
     # ── Always start the web server first (runs in background) ───────────────
@@ -361,12 +669,11 @@ Examples:
     if args.web_only:
         info("--web-only mode. Press Ctrl+C to stop.")
         try:
-            while True:
-                time.sleep(60)
+            _idle()
         except KeyboardInterrupt:
             print()
-            warn("Shutting down…")
-            stop_webapp()
+        warn("Shutting down…")
+        stop_webapp()
         return
 
     # ── Pipeline loop ─────────────────────────────────────────────────────────
@@ -392,12 +699,8 @@ Examples:
             info(f"  Next run at: {wake_at.strftime('%Y-%m-%d %H:%M:%S')}")
             info("  (Ctrl+C to stop the scheduler and web server)\n")
 
-            _countdown(wake_at)
-
-            # Sleep in small chunks so Ctrl+C is responsive
-            sleep_end = time.time() + interval_sec
-            while time.time() < sleep_end:
-                time.sleep(1)
+            if _sleep_until(wake_at):
+                break
 
     except KeyboardInterrupt:
         print(f"\n\n{YELLOW}  Interrupted by user.{RESET}")
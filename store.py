@@ -0,0 +1,79 @@
+"""
+==========================================================================
+  CinebyHub — SQLite content store
+==========================================================================
+  Keeps every normalised row scraped by cineby_scraper.py in a small
+  SQLite file (content.db), one table per sheet, keyed by TMDB / Network
+  ID. Incremental runs read the set of known IDs with a single SELECT
+  instead of re-parsing the styled Excel workbook, and the workbook is
+  rebuilt from here on every run as a pure export step.
+==========================================================================
+"""
+
+import json
+import sqlite3
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+# One table per content sheet; the scraper's main() maps sheets onto them
+TABLES = ("movies", "tv", "anime", "anime_movies", "channels")
+
+
+def open_store(path):
+    """Open (or create) the content store and make sure every table exists."""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    for table in TABLES:
+        # The implicit rowid keeps insertion order, so existing rows stay
+        # ahead of newly scraped ones when the sheet is exported.
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            f"id INTEGER NOT NULL UNIQUE, json BLOB NOT NULL)"
+        )
+    conn.commit()
+    return conn
+
+
+def is_empty(conn):
+    return all(count(conn, table) == 0 for table in TABLES)
+
+
+def clear(conn):
+    for table in TABLES:
+        conn.execute(f"DELETE FROM {table}")
+    conn.commit()
+
+
+def load_ids(conn, table):
+    # frozenset: shared read-only by every fetch job, never re-hashed
+    return frozenset(r[0] for r in conn.execute(f"SELECT id FROM {table}"))
+
+
+def count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def insert_rows(conn, table, rows, id_col="TMDB ID"):
+    """Insert normalised row dicts; rows whose ID is already stored are ignored."""
+    conn.executemany(
+        f"INSERT OR IGNORE INTO {table} (id, json) VALUES (?, ?)",
+        ((r[id_col], _dumps(r)) for r in rows if r.get(id_col) not in (None, "")),
+    )
+    conn.commit()
+
+
+def iter_rows(conn, table):
+    """Yield stored row dicts in insertion order."""
+    for (blob,) in conn.execute(f"SELECT json FROM {table} ORDER BY rowid"):
+        yield _loads(blob)